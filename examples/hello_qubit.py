@@ -1,4 +1,5 @@
 import cirq
+from quantum_algos.sampling import sample_counts
 from quantum_algos.visualization import plot_histogram, save_circuit_svg
 
 # Pick a qubit.
@@ -14,19 +15,15 @@ print("Circuit:")
 print(circuit)
 save_circuit_svg(circuit, "hello_qubit_circuit.svg")
 
-# Simulate the circuit
-simulator = cirq.Simulator()
-result = simulator.run(circuit, repetitions=20)
+# Simulate the circuit, accumulating bit-packed counts chunk by chunk
+counts = sample_counts(circuit, key='m', repetitions=20)
 
 print("\nResults:")
-print(result)
-
-# Get the histogram
-histogram = result.histogram(key='m')
+print(counts)
 
 # Plot the histogram
 print("\nHistogram:")
-print(histogram)
+print(counts.to_dict())
 
-# Visualize using utility
-plot_histogram(histogram, filename="hello_qubit_histogram.png")
+# Visualize using utility (works directly on the packed counts)
+plot_histogram(counts, filename="hello_qubit_histogram.png")
@@ -1,26 +1,57 @@
 import cirq
 import numpy as np
+import scipy.sparse
 from scipy.sparse.linalg import eigsh
+from typing import Optional, Tuple, Union
+from quantum_algos.packed_hamiltonian import PackedHamiltonian
+
+# Matrices up to this dimension (10 qubits) are diagonalized densely
+_DENSE_MAX_DIM = 1024
 
 class ClassicalEigensolver:
     """Calculates exact eigenvalues classically."""
 
-    def __init__(self, hamiltonian: cirq.PauliSum):
+    def __init__(self, hamiltonian: Union[cirq.PauliSum, PackedHamiltonian]):
         self.hamiltonian = hamiltonian
 
+    def _matrix(self):
+        if isinstance(self.hamiltonian, PackedHamiltonian):
+            # Built directly from the bitmasks, without PauliSum objects
+            return self.hamiltonian.sparse_matrix()
+        # Convert PauliSum to dense matrix
+        return self.hamiltonian.matrix()
+
+    def _lowest(self, vectors: bool) -> Tuple[float, Optional[np.ndarray]]:
+        """
+        Lowest eigenvalue (and its eigenvector if `vectors`), solved densely for
+        up to 10 qubits and with scipy's sparse eigsh above that.
+        """
+        matrix = self._matrix()
+        if matrix.shape[0] <= _DENSE_MAX_DIM:
+            if scipy.sparse.issparse(matrix):
+                matrix = matrix.toarray()
+            if not vectors:
+                return float(np.linalg.eigvalsh(matrix)[0]), None
+            eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+            return float(eigenvalues[0]), eigenvectors[:, 0]
+        # k=1 returns 1 eigenvalue, which='SA' means Smallest Algebraic
+        if not vectors:
+            return float(eigsh(matrix, k=1, which='SA', return_eigenvectors=False)[0]), None
+        eigenvalues, eigenvectors = eigsh(matrix, k=1, which='SA')
+        return float(eigenvalues[0]), eigenvectors[:, 0]
+
     def compute_ground_state_energy(self) -> float:
         """
         Computes the minimum eigenvalue (ground state energy) of the Hamiltonian.
         """
-        # Convert PauliSum to sparse matrix
-        matrix = self.hamiltonian.matrix()
-        
-        # If matrix is small, use numpy.linalg.eigh (returns all eigenvalues)
-        if matrix.shape[0] <= 1024: # 10 qubits
-             eigenvalues = np.linalg.eigvalsh(matrix)
-             return float(np.min(eigenvalues))
-        else:
-             # Use scipy.sparse.linalg.eigsh for larger sparse matrices
-             # k=1 returns 1 eigenvalue, which='SA' means Smallest Algebraic
-             eigenvalues, _ = eigsh(matrix, k=1, which='SA')
-             return float(eigenvalues[0])
+        return self._lowest(vectors=False)[0]
+
+    def compute_ground_state(self) -> Tuple[float, np.ndarray]:
+        """
+        Computes the ground state energy and a normalized ground state vector.
+
+        The vector is in the Hamiltonian's qubit order (sorted qubits for a PauliSum).
+        Large vectors can be shared with worker processes via
+        `quantum_algos.shared_arrays.SharedArray` instead of being pickled.
+        """
+        return self._lowest(vectors=True)
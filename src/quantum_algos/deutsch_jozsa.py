@@ -1,19 +1,37 @@
-from typing import List, Callable, Dict
+from typing import List, Callable, Dict, Optional
 import cirq
-from quantum_algos.errors import OracleValueError, QubitCountError
+from quantum_algos.errors import NoiseModelError, OracleValueError, QubitCountError
+from quantum_algos.noise import NoiseModel, TrajectorySimulator, TrajectoryResult
+from quantum_algos.sampling import sample_counts
 
 class DeutschJozsa:
     """Class to run the Deutsch-Jozsa algorithm using Cirq."""
 
-    def __init__(self, n_qubits: int, oracle: Callable[[List[cirq.Qid], cirq.Qid], cirq.OP_TREE]):
+    def __init__(self,
+                 n_qubits: int,
+                 oracle: Callable[[List[cirq.Qid], cirq.Qid], cirq.OP_TREE],
+                 noise_model: Optional[NoiseModel] = None,
+                 trajectory_simulator: Optional[TrajectorySimulator] = None):
         """
         Args:
             n_qubits: Number of input qubits (not including the helper qubit).
             oracle: A function that takes a list of input qubits and a helper qubit,
                     and yields operations representing the oracle U_f.
+            noise_model: Optional noise model. If given, the all-zeros probability is
+                         estimated from quantum trajectories.
+            trajectory_simulator: Optional trajectory settings (precision, workers, seed).
+                                  Defaults to a TrajectorySimulator for `noise_model`.
+                                  It carries its own noise model, so passing both
+                                  raises NoiseModelError.
         """
         self.n = n_qubits
         self.oracle = oracle
+        if noise_model is not None and trajectory_simulator is not None:
+            raise NoiseModelError("Pass either noise_model or trajectory_simulator, not both")
+        if trajectory_simulator is None and noise_model is not None:
+            trajectory_simulator = TrajectorySimulator(noise_model)
+        self.trajectory_simulator = trajectory_simulator
+        self.last_estimate: Optional[TrajectoryResult] = None
         self.input_qubits = cirq.LineQubit.range(n_qubits)
         self.helper_qubit = cirq.LineQubit(n_qubits)
         self.circuit = self._create_circuit()
@@ -47,14 +65,22 @@ class DeutschJozsa:
         Returns:
             "Constant" if measurement is all 0s.
             "Balanced" if measurement is 1 for half of the elements, 0 for the other half.
+
+        Shots are accumulated as bit-packed counts and the most frequent outcome
+        decides. With a noise model, `repetitions` is ignored: the oracle is
+        "Constant" if the estimated probability of measuring all 0s is above 1/2.
         """
-        simulator = cirq.Simulator()
-        result = simulator.run(self.circuit, repetitions=repetitions)
-        measurements = result.measurements['result'][0] # Check the first run
-        print("Measurements:", measurements)
+        if self.trajectory_simulator is not None:
+            self.last_estimate = self.trajectory_simulator.all_zero_probability(self.circuit, 'result')
+            print("P(all zeros):", self.last_estimate)
+            return "Constant" if self.last_estimate.mean > 0.5 else "Balanced"
+
+        counts = sample_counts(self.circuit, 'result', repetitions)
+        outcome, _ = counts.most_common(1)[0]
+        print("Measurements:", counts.bitstring(outcome))
 
         # If all input bits are 0, it's constant. Otherwise, balanced.
-        if sum(measurements) == 0:
+        if outcome == 0:
             return "Constant"
         else:
             return "Balanced"
@@ -17,3 +17,23 @@ class QubitCountError(QuantumAlgoError):
 class CircuitError(QuantumAlgoError):
     """Exception raised for errors during circuit construction."""
     pass
+
+class NoiseModelError(QuantumAlgoError):
+    """Exception raised for invalid noise model or trajectory settings."""
+    pass
+
+class JobError(QuantumAlgoError):
+    """Exception raised for errors in the asynchronous job runner."""
+    pass
+
+class JobTimeoutError(JobError):
+    """Exception raised when a job exceeds its timeout."""
+    pass
+
+class HamiltonianFormatError(QuantumAlgoError):
+    """Exception raised for invalid packed Hamiltonian data or files."""
+    pass
+
+class SharedArrayError(QuantumAlgoError):
+    """Exception raised for invalid use of shared-memory arrays."""
+    pass
@@ -0,0 +1,346 @@
+import asyncio
+import copy
+import itertools
+import os
+import cirq
+import sympy
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import List, Callable, Dict, Optional, Any, Hashable, Union
+from quantum_algos.errors import JobError, JobTimeoutError
+from quantum_algos.vqe import VQE
+from quantum_algos.deutsch_jozsa import DeutschJozsa
+from quantum_algos.packed_hamiltonian import PackedHamiltonian
+from quantum_algos.noise import TrajectorySimulator
+from classical_algos.eigensolver import ClassicalEigensolver
+
+# Job states reported to progress callbacks
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMEOUT = "timeout"
+
+# How often a dispatcher checks whether the executor has started its work
+_START_POLL_INTERVAL = 0.01
+
+class _FixedAnsatz:
+    """Picklable ansatz that returns a prebuilt parameterized circuit."""
+
+    def __init__(self, circuit: cirq.Circuit):
+        self.circuit = circuit
+
+    def __call__(self, qubits: List[cirq.Qid], symbols: Any) -> cirq.Circuit:
+        return self.circuit
+
+class _FixedOracle:
+    """Picklable oracle that yields prebuilt operations."""
+
+    def __init__(self, operations: List[cirq.Operation]):
+        self.operations = operations
+
+    def __call__(self, input_qubits: List[cirq.Qid], helper_qubit: cirq.Qid) -> cirq.OP_TREE:
+        return self.operations
+
+def _to_picklable(hamiltonian):
+    """PauliSum is not picklable, so it is shipped as its list of terms."""
+    if isinstance(hamiltonian, PackedHamiltonian):
+        return hamiltonian
+    return list(cirq.PauliSum.wrap(hamiltonian))
+
+def _from_picklable(hamiltonian):
+    if isinstance(hamiltonian, PackedHamiltonian):
+        return hamiltonian
+    return cirq.PauliSum.from_pauli_strings(hamiltonian)
+
+def _serial(trajectory_simulator: Optional[TrajectorySimulator]) -> Optional[TrajectorySimulator]:
+    """Copy of the simulator that runs trajectories in the job's own worker."""
+    if trajectory_simulator is None:
+        return None
+    # A nested pool per job would multiply processes; the runner's pool is the
+    # unit of parallelism. The copy drops any executor (see __getstate__).
+    serial = copy.copy(trajectory_simulator)
+    serial.max_workers = 1
+    return serial
+
+def _minimize_vqe(qubits, circuit, hamiltonian, trajectory_simulator, initial_params, symbols, method):
+    vqe = VQE(qubits, _FixedAnsatz(circuit), _from_picklable(hamiltonian),
+              trajectory_simulator=_serial(trajectory_simulator))
+    return vqe.minimize(initial_params, symbols, method=method)
+
+def _ground_state_energy(hamiltonian):
+    return ClassicalEigensolver(_from_picklable(hamiltonian)).compute_ground_state_energy()
+
+def _run_deutsch_jozsa(n_qubits, operations, trajectory_simulator, repetitions):
+    dj = DeutschJozsa(n_qubits, _FixedOracle(operations), trajectory_simulator=_serial(trajectory_simulator))
+    return dj.run(repetitions)
+
+def _hamiltonian_key(hamiltonian: Union[cirq.PauliSum, PackedHamiltonian]) -> tuple:
+    """Canonical, hashable form of a Hamiltonian (independent of term order)."""
+    if isinstance(hamiltonian, PackedHamiltonian):
+        return ("packed", hamiltonian.fingerprint())
+    terms = []
+    for term in cirq.PauliSum.wrap(hamiltonian):
+        paulis = tuple(sorted((repr(q), repr(p)) for q, p in term.items()))
+        terms.append((paulis, complex(term.coefficient)))
+    return tuple(sorted(terms, key=lambda t: t[0]))
+
+class _Task:
+    """One underlying computation, shared by every Job that deduplicates onto it."""
+
+    def __init__(self,
+                 key: Hashable,
+                 fn: Callable,
+                 args: tuple,
+                 timeout: Optional[float],
+                 on_release: Callable[["_Task"], None]):
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.timeout = timeout
+        self.on_release = on_release
+        self.state = QUEUED
+        self.jobs: List["Job"] = []
+        self.execution: Optional[asyncio.Future] = None
+
+    def cancel(self):
+        self.state = CANCELLED
+        self.on_release(self)
+        if self.execution is not None:
+            self.execution.cancel()
+
+    def notify(self, state: str):
+        self.state = state
+        for job in self.jobs:
+            job._notify(state)
+
+class Job:
+    """Handle to a submitted job. Await it (or `result()`) to get the return value."""
+
+    def __init__(self, task: _Task, progress: Optional[Callable[["Job", str], None]]):
+        self._task = task
+        self._progress = progress
+        self._future = asyncio.get_running_loop().create_future()
+
+    @property
+    def state(self) -> str:
+        if self._future.cancelled():
+            return CANCELLED
+        return self._task.state
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    async def result(self) -> Any:
+        return await asyncio.shield(self._future)
+
+    def __await__(self):
+        return self.result().__await__()
+
+    def cancel(self) -> bool:
+        """
+        Cancels this job. The underlying computation is only cancelled once every
+        job sharing it has been cancelled.
+
+        Note: a computation already running in a worker process cannot be
+        interrupted; its result is discarded.
+        """
+        if self._future.done():
+            return False
+        self._future.cancel()
+        self._notify(CANCELLED)
+        task = self._task
+        task.jobs.remove(self)
+        if not task.jobs:
+            task.cancel()
+        return True
+
+    def _notify(self, state: str):
+        if self._progress is not None:
+            self._progress(self, state)
+
+    def _set_result(self, value: Any):
+        if not self._future.done():
+            self._future.set_result(value)
+
+    def _set_exception(self, exc: BaseException):
+        if not self._future.done():
+            self._future.set_exception(exc)
+
+class JobRunner:
+    """
+    Runs VQE, eigensolver and Deutsch-Jozsa jobs concurrently from asyncio.
+
+    CPU-bound work is dispatched to a bounded process pool. Jobs are started in
+    priority order (lower value first), and identical in-flight jobs share one
+    computation. A job's timeout counts from the moment a worker picks it up.
+    Work that times out or is cancelled while running cannot be interrupted, so
+    its slot stays occupied until the worker actually finishes it.
+
+    The runner's pool is the unit of parallelism: noisy jobs run their
+    trajectories serially inside their worker, whatever the `max_workers` of
+    their TrajectorySimulator.
+
+    Usage:
+        async with JobRunner(max_workers=4) as runner:
+            job = runner.submit_ground_state(hamiltonian)
+            energy = await job
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, executor: Optional[Executor] = None):
+        """
+        Args:
+            max_workers: Maximum number of jobs running at once. Required when
+                         `executor` is given (use its worker count).
+            executor: Optional executor to run jobs on. Defaults to a
+                      ProcessPoolExecutor with `max_workers` processes.
+        """
+        if executor is not None and max_workers is None:
+            raise JobError("max_workers is required when an executor is passed in")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._dispatchers: List[asyncio.Task] = []
+        self._in_flight: Dict[Hashable, _Task] = {}
+        self._counter = itertools.count()
+
+    async def __aenter__(self) -> "JobRunner":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def start(self):
+        """Starts the worker pool and dispatchers. Must be called from a running event loop."""
+        if self._queue is not None:
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._queue = asyncio.PriorityQueue()
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.max_workers)]
+
+    async def close(self):
+        """Stops dispatching, cancels unfinished jobs and shuts down the owned pool."""
+        unfinished = list(self._in_flight.values())
+        for dispatcher in self._dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+        for task in unfinished:
+            for job in list(task.jobs):
+                job.cancel()
+        self._in_flight.clear()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._queue = None
+
+    def submit_vqe(self,
+                   vqe: VQE,
+                   initial_params: List[float],
+                   symbols: List[sympy.Symbol],
+                   method: str = 'COBYLA',
+                   priority: int = 0,
+                   timeout: Optional[float] = None,
+                   progress: Optional[Callable[[Job, str], None]] = None) -> Job:
+        """
+        Submits `vqe.minimize(initial_params, symbols, method)`.
+
+        The ansatz is evaluated once here and shipped to the worker as a circuit,
+        so it does not need to be picklable. The history of the worker-side VQE
+        is not copied back into `vqe`.
+        """
+        circuit = vqe.ansatz(vqe.qubits, symbols)
+        key = ("vqe", repr(vqe.qubits), repr(circuit), _hamiltonian_key(vqe.hamiltonian),
+               tuple(float(p) for p in initial_params), tuple(str(s) for s in symbols),
+               method, id(vqe.trajectory_simulator))
+        args = (vqe.qubits, circuit, _to_picklable(vqe.hamiltonian), vqe.trajectory_simulator,
+                list(initial_params), list(symbols), method)
+        return self._submit(key, _minimize_vqe, args, priority, timeout, progress)
+
+    def submit_ground_state(self,
+                            hamiltonian: Union[cirq.PauliSum, PackedHamiltonian],
+                            priority: int = 0,
+                            timeout: Optional[float] = None,
+                            progress: Optional[Callable[[Job, str], None]] = None) -> Job:
+        """Submits `ClassicalEigensolver(hamiltonian).compute_ground_state_energy()`."""
+        key = ("ground_state", _hamiltonian_key(hamiltonian))
+        args = (_to_picklable(hamiltonian),)
+        return self._submit(key, _ground_state_energy, args, priority, timeout, progress)
+
+    def submit_deutsch_jozsa(self,
+                             dj: DeutschJozsa,
+                             repetitions: int = 1,
+                             priority: int = 0,
+                             timeout: Optional[float] = None,
+                             progress: Optional[Callable[[Job, str], None]] = None) -> Job:
+        """Submits `dj.run(repetitions)`. The oracle is expanded to operations here."""
+        operations = list(cirq.flatten_to_ops(dj.oracle(dj.input_qubits, dj.helper_qubit)))
+        key = ("deutsch_jozsa", dj.n, repr(operations), repetitions, id(dj.trajectory_simulator))
+        args = (dj.n, operations, dj.trajectory_simulator, repetitions)
+        return self._submit(key, _run_deutsch_jozsa, args, priority, timeout, progress)
+
+    def _submit(self, key, fn, args, priority, timeout, progress) -> Job:
+        if self._queue is None:
+            raise JobError("JobRunner is not started; use 'async with JobRunner()' or call start()")
+        task = self._in_flight.get(key)
+        is_new = task is None
+        if is_new:
+            task = _Task(key, fn, args, timeout, self._finish)
+            self._in_flight[key] = task
+        job = Job(task, progress)
+        task.jobs.append(job)
+        if is_new or task.state == QUEUED:
+            # A shared job re-enters the queue so a higher priority takes effect;
+            # the dispatcher skips entries for tasks that have already started.
+            self._queue.put_nowait((priority, next(self._counter), task))
+        job._notify(task.state)
+        return job
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, task = await self._queue.get()
+            if task.state != QUEUED:
+                continue
+            work = self._executor.submit(task.fn, *task.args)
+            task.execution = asyncio.wrap_future(work, loop=loop)
+            try:
+                # The timeout clock starts once a worker has picked up the work
+                while not (work.running() or work.done()):
+                    await asyncio.sleep(_START_POLL_INTERVAL)
+                if task.state == QUEUED:
+                    task.notify(RUNNING)
+                value = await asyncio.wait_for(task.execution, task.timeout)
+            except asyncio.TimeoutError:
+                self._finish(task)
+                task.notify(TIMEOUT)
+                for job in task.jobs:
+                    job._set_exception(JobTimeoutError(f"Job timed out after {task.timeout} s"))
+                await self._wait_released(work)
+            except asyncio.CancelledError:
+                self._finish(task)
+                if task.state != CANCELLED:
+                    raise
+                await self._wait_released(work)
+            except Exception as exc:
+                self._finish(task)
+                task.notify(FAILED)
+                for job in task.jobs:
+                    job._set_exception(exc)
+            else:
+                self._finish(task)
+                task.notify(DONE)
+                for job in task.jobs:
+                    job._set_result(value)
+
+    @staticmethod
+    async def _wait_released(work: Future):
+        """Holds the dispatcher slot until abandoned work really leaves the executor."""
+        await asyncio.wait([asyncio.wrap_future(work)])
+
+    def _finish(self, task: _Task):
+        if self._in_flight.get(task.key) is task:
+            del self._in_flight[task.key]
@@ -0,0 +1,293 @@
+import os
+import cirq
+import numpy as np
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Callable, Dict, Optional, Union
+from quantum_algos.errors import NoiseModelError
+from quantum_algos.packed_hamiltonian import PackedHamiltonian
+
+class NoiseModel:
+    """
+    Describes the noise applied to a circuit during trajectory simulation.
+
+    Gate noise (depolarizing, amplitude damping) is inserted after every moment
+    on every qubit of the circuit, except on qubits measured in that moment.
+    Readout error is a symmetric bit flip applied
+    right before each measurement.
+    """
+
+    def __init__(self,
+                 depolarizing: float = 0.0,
+                 amplitude_damping: float = 0.0,
+                 readout_error: float = 0.0):
+        """
+        Args:
+            depolarizing: Single-qubit depolarizing probability per moment.
+            amplitude_damping: Amplitude damping rate (gamma) per moment.
+            readout_error: Probability that a measured bit is flipped.
+        """
+        for name, value in [("depolarizing", depolarizing),
+                            ("amplitude_damping", amplitude_damping),
+                            ("readout_error", readout_error)]:
+            if not 0.0 <= value <= 1.0:
+                raise NoiseModelError(f"{name} probability must be in [0, 1], got {value}")
+        self.depolarizing = depolarizing
+        self.amplitude_damping = amplitude_damping
+        self.readout_error = readout_error
+
+    def __repr__(self) -> str:
+        return (f"NoiseModel(depolarizing={self.depolarizing}, "
+                f"amplitude_damping={self.amplitude_damping}, "
+                f"readout_error={self.readout_error})")
+
+    @property
+    def is_noiseless(self) -> bool:
+        return self.depolarizing == 0 and self.amplitude_damping == 0 and self.readout_error == 0
+
+    def noisy_circuit(self, circuit: cirq.Circuit) -> cirq.Circuit:
+        """Returns a copy of the circuit with the noise channels inserted."""
+        if self.is_noiseless:
+            return circuit.copy()
+        qubits = sorted(circuit.all_qubits())
+        noisy = cirq.Circuit()
+        for moment in circuit:
+            measured = {q for op in moment if cirq.is_measurement(op) for q in op.qubits}
+            if measured and self.readout_error > 0:
+                noisy.append(cirq.Moment(cirq.bit_flip(self.readout_error).on_each(sorted(measured))))
+            noisy.append(moment)
+            noisy_qubits = [q for q in qubits if q not in measured]
+            if noisy_qubits and self.depolarizing > 0:
+                noisy.append(cirq.Moment(cirq.depolarize(self.depolarizing).on_each(noisy_qubits)))
+            if noisy_qubits and self.amplitude_damping > 0:
+                noisy.append(cirq.Moment(cirq.amplitude_damp(self.amplitude_damping).on_each(noisy_qubits)))
+        return noisy
+
+    def readout_attenuated(self,
+                           hamiltonian: Union[cirq.PauliSum, PackedHamiltonian]
+                           ) -> Union[cirq.PauliSum, PackedHamiltonian]:
+        """
+        Folds readout error into the Hamiltonian.
+
+        Measuring a Pauli string of weight w with symmetric bit-flip probability p
+        on each qubit scales its expectation value by (1 - 2p)^w.
+        """
+        factor = 1.0 - 2.0 * self.readout_error
+        if isinstance(hamiltonian, PackedHamiltonian):
+            if self.readout_error == 0:
+                return hamiltonian
+            return hamiltonian.with_coefficients(hamiltonian.coefficients * factor ** hamiltonian.weights())
+        hamiltonian = cirq.PauliSum.wrap(hamiltonian)
+        if self.readout_error == 0:
+            return hamiltonian
+        return cirq.PauliSum.from_pauli_strings(
+            [factor ** len(term) * term for term in hamiltonian]
+        )
+
+class TrajectoryResult:
+    """Monte Carlo estimate aggregated over quantum trajectories."""
+
+    def __init__(self, mean: float, stderr: float, n_trajectories: int, converged: bool):
+        self.mean = mean
+        self.stderr = stderr
+        self.n_trajectories = n_trajectories
+        self.converged = converged
+
+    def __repr__(self) -> str:
+        return (f"TrajectoryResult(mean={self.mean:.6f}, stderr={self.stderr:.6f}, "
+                f"n_trajectories={self.n_trajectories}, converged={self.converged})")
+
+class _RunningStats:
+    """Running mean / standard error over batches of samples (Chan's parallel update)."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, samples: np.ndarray):
+        samples = np.asarray(samples, dtype=float)
+        if samples.size == 0:
+            return
+        n_b = samples.size
+        mean_b = float(np.mean(samples))
+        m2_b = float(np.sum((samples - mean_b) ** 2))
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta ** 2 * self.n * n_b / n
+        self.n = n
+
+    @property
+    def stderr(self) -> float:
+        if self.n < 2:
+            return float('inf')
+        return float(np.sqrt(self.m2 / (self.n - 1) / self.n))
+
+def _expectation_batch(circuit: cirq.Circuit,
+                       hamiltonian: Union[List[cirq.PauliString], PackedHamiltonian],
+                       qubit_map: Dict[cirq.Qid, int],
+                       n_trajectories: int,
+                       seed: int) -> np.ndarray:
+    """Worker: <H> on each of `n_trajectories` pure-state trajectories."""
+    if isinstance(hamiltonian, list):
+        # PauliSum itself is not picklable, so it is shipped as its list of terms
+        hamiltonian = cirq.PauliSum.from_pauli_strings(hamiltonian)
+    simulator = cirq.Simulator(seed=seed)
+    values = np.empty(n_trajectories)
+    for i in range(n_trajectories):
+        state = simulator.simulate(circuit, qubit_order=list(qubit_map)).final_state_vector
+        values[i] = hamiltonian.expectation_from_state_vector(state, qubit_map=qubit_map).real
+    return values
+
+def _all_zero_batch(circuit: cirq.Circuit, key: str, n_trajectories: int, seed: int) -> np.ndarray:
+    """Worker: 1.0 for each shot whose measurement under `key` is all zeros, else 0.0."""
+    simulator = cirq.Simulator(seed=seed)
+    result = simulator.run(circuit, repetitions=n_trajectories)
+    return (~result.measurements[key].any(axis=1)).astype(float)
+
+class TrajectorySimulator:
+    """
+    Simulates noisy circuits by sampling pure-state quantum trajectories.
+
+    Each trajectory keeps a 2^n state vector (instead of the 4^n density matrix),
+    so memory stays bounded. Batches of trajectories are distributed over worker
+    processes and averaged in submission order; sampling stops early once the
+    running standard error drops below `target_precision`. A seeded run therefore
+    uses the same trajectories regardless of `max_workers` or scheduling.
+
+    The worker pool is created on first use and reused across calls (e.g. every
+    cost evaluation of a noisy VQE); call `close()` or use the simulator as a
+    context manager to shut it down.
+    """
+
+    def __init__(self,
+                 noise_model: NoiseModel,
+                 max_trajectories: int = 1000,
+                 target_precision: Optional[float] = None,
+                 batch_size: int = 50,
+                 max_workers: Optional[int] = None,
+                 seed: Optional[int] = None,
+                 progress: Optional[Callable[[TrajectoryResult], None]] = None,
+                 executor: Optional[Executor] = None):
+        """
+        Args:
+            noise_model: The noise to apply.
+            max_trajectories: Upper bound on the number of trajectories.
+            target_precision: Stop once the standard error is at or below this value.
+                              If None, all `max_trajectories` are run.
+            batch_size: Trajectories per worker task.
+            max_workers: Number of worker processes (default: CPU count).
+                         With 1, trajectories run in the calling process.
+            seed: Seed for reproducible trajectory sampling.
+            progress: Optional callback receiving the running estimate after each batch.
+            executor: Optional caller-owned executor to run batches on (not shut
+                      down by `close()`). Defaults to a ProcessPoolExecutor with
+                      `max_workers` processes, created on first use.
+        """
+        if max_trajectories < 1 or batch_size < 1:
+            raise NoiseModelError("max_trajectories and batch_size must be positive")
+        self.noise_model = noise_model
+        self.max_trajectories = max_trajectories
+        self.target_precision = target_precision
+        self.batch_size = batch_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.progress = progress
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def __enter__(self) -> "TrajectorySimulator":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        # The worker pool stays in the creating process
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_owns_executor"] = True
+        return state
+
+    def close(self):
+        """Shuts down the worker pool if this simulator created it."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self._owns_executor:
+            self._executor = None
+
+    def expectation(self,
+                    circuit: cirq.Circuit,
+                    hamiltonian: Union[cirq.PauliSum, PackedHamiltonian],
+                    qubits: List[cirq.Qid]) -> TrajectoryResult:
+        """
+        Estimates <H> of a resolved (parameter-free) circuit under noise.
+
+        Measurements in the circuit are ignored; readout error is folded into
+        the Hamiltonian instead.
+        """
+        noisy = self.noise_model.noisy_circuit(cirq.drop_terminal_measurements(circuit))
+        hamiltonian = self.noise_model.readout_attenuated(hamiltonian)
+        if isinstance(hamiltonian, cirq.PauliSum):
+            hamiltonian = list(hamiltonian)
+        qubit_map = {q: i for i, q in enumerate(qubits)}
+        if self.noise_model.is_noiseless:
+            # Every trajectory is the exact state: a single one is the answer
+            value = _expectation_batch(noisy, hamiltonian, qubit_map, 1, 0)[0]
+            return TrajectoryResult(float(value), 0.0, 1, True)
+        return self._run(_expectation_batch, (noisy, hamiltonian, qubit_map))
+
+    def all_zero_probability(self, circuit: cirq.Circuit, key: str) -> TrajectoryResult:
+        """Estimates the probability that the measurement `key` returns all zeros."""
+        noisy = self.noise_model.noisy_circuit(circuit)
+        return self._run(_all_zero_batch, (noisy, key))
+
+    def _run(self, worker: Callable[..., np.ndarray], args: tuple) -> TrajectoryResult:
+        stats = _RunningStats()
+        batches = []
+        remaining = self.max_trajectories
+        while remaining > 0:
+            batches.append(min(self.batch_size, remaining))
+            remaining -= batches[-1]
+        seeds = [int(s.generate_state(1)[0]) for s in self.seed_sequence.spawn(len(batches))]
+        tasks = iter(zip(batches, seeds))
+
+        if self.max_workers == 1:
+            for size, seed in tasks:
+                stats.update(worker(*args, size, seed))
+                if self._report(stats):
+                    break
+            return self._result(stats)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        # Batches are consumed in submission order, so the stopping point (and the
+        # set of trajectories used) matches the serial path for a given seed.
+        pending = deque()
+        for size, seed in tasks:
+            pending.append(self._executor.submit(worker, *args, size, seed))
+            if len(pending) >= 2 * self.max_workers:
+                break
+        while pending:
+            stats.update(pending.popleft().result())
+            if self._report(stats):
+                for future in pending:
+                    future.cancel()
+                break
+            task = next(tasks, None)
+            if task is not None:
+                pending.append(self._executor.submit(worker, *args, *task))
+        return self._result(stats)
+
+    def _converged(self, stats: _RunningStats) -> bool:
+        return self.target_precision is not None and stats.stderr <= self.target_precision
+
+    def _report(self, stats: _RunningStats) -> bool:
+        """Reports progress and returns True when the target precision is reached."""
+        if self.progress is not None:
+            self.progress(self._result(stats))
+        return self._converged(stats)
+
+    def _result(self, stats: _RunningStats) -> TrajectoryResult:
+        return TrajectoryResult(stats.mean, stats.stderr, stats.n, self._converged(stats))
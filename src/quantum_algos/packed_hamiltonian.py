@@ -0,0 +1,284 @@
+import hashlib
+import json
+import cirq
+import numpy as np
+import scipy.sparse
+from typing import Dict, Optional, Sequence, Tuple
+from quantum_algos.errors import HamiltonianFormatError
+
+_MAGIC = b"PHAM\x01\x00\x00\x00"
+_ALIGNMENT = 64
+_PAULIS = {(1, 0): cirq.X, (1, 1): cirq.Y, (0, 1): cirq.Z}
+
+def _parity(values: np.ndarray) -> np.ndarray:
+    """Parity of the popcount of each (non-negative, < 2^63) integer."""
+    v = values.astype(np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        v = v ^ (v >> shift)
+    return v & 1
+
+def _load_with_coefficients(path: str, coefficients: np.ndarray) -> "PackedHamiltonian":
+    return PackedHamiltonian.load(path).with_coefficients(coefficients)
+
+class PackedHamiltonian:
+    """
+    A Hamiltonian stored as packed X/Z bitmasks plus a coefficient array.
+
+    Term t is `coefficients[t] * P_0 ⊗ P_1 ⊗ ...` where P_k is I, X, Z or Y
+    according to bit k of `x_bits[t]` / `z_bits[t]` (X: x=1, Z: z=1, Y: both).
+    Bits are stored little-endian in uint64 words, so `x_bits` and `z_bits`
+    have shape (n_terms, ceil(n_qubits / 64)).
+
+    Instances saved with `save` can be loaded memory-mapped with `load`, so
+    worker processes share the same pages instead of rebuilding `cirq.PauliSum`s.
+    """
+
+    def __init__(self,
+                 qubits: Sequence[cirq.Qid],
+                 x_bits: np.ndarray,
+                 z_bits: np.ndarray,
+                 coefficients: np.ndarray,
+                 path: Optional[str] = None):
+        """
+        Args:
+            qubits: Qubits in bit order (qubit k is bit k).
+            x_bits: uint64 array of shape (n_terms, n_words).
+            z_bits: uint64 array of shape (n_terms, n_words).
+            coefficients: complex128 array of shape (n_terms,).
+            path: File the arrays are memory-mapped from, if any.
+        """
+        n_words = max(1, -(-len(qubits) // 64))
+        if x_bits.shape != z_bits.shape or x_bits.shape != (len(coefficients), n_words):
+            raise HamiltonianFormatError(
+                f"Bitmask shapes {x_bits.shape}/{z_bits.shape} do not match "
+                f"{len(coefficients)} terms on {len(qubits)} qubits"
+            )
+        self.qubits = list(qubits)
+        self.x_bits = x_bits
+        self.z_bits = z_bits
+        self.coefficients = coefficients
+        self.path = path
+        self._fingerprint: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.coefficients)
+
+    def __repr__(self) -> str:
+        return f"PackedHamiltonian(n_qubits={self.n_qubits}, n_terms={len(self)})"
+
+    def __reduce__(self):
+        # Memory-mapped instances are re-opened by path in other processes
+        # instead of copying the arrays through pickle. Coefficients replaced by
+        # `with_coefficients` are the only array that is shipped.
+        if self.path is not None:
+            if isinstance(self.coefficients, np.memmap):
+                return (PackedHamiltonian.load, (self.path,))
+            return (_load_with_coefficients, (self.path, self.coefficients))
+        return (PackedHamiltonian, (self.qubits, self.x_bits, self.z_bits, self.coefficients))
+
+    @property
+    def n_qubits(self) -> int:
+        return len(self.qubits)
+
+    @classmethod
+    def from_pauli_sum(cls,
+                       hamiltonian: cirq.PauliSum,
+                       qubits: Optional[Sequence[cirq.Qid]] = None) -> "PackedHamiltonian":
+        """
+        Packs a PauliSum.
+
+        Args:
+            hamiltonian: The Hamiltonian (a PauliSum or a single PauliString).
+            qubits: Bit order. Defaults to the sorted qubits of the Hamiltonian.
+        """
+        hamiltonian = cirq.PauliSum.wrap(hamiltonian)
+        if qubits is None:
+            qubits = sorted(hamiltonian.qubits)
+        index = {q: k for k, q in enumerate(qubits)}
+        terms = list(hamiltonian)
+        n_words = max(1, -(-len(qubits) // 64))
+        x_bits = np.zeros((len(terms), n_words), dtype=np.uint64)
+        z_bits = np.zeros((len(terms), n_words), dtype=np.uint64)
+        coefficients = np.empty(len(terms), dtype=np.complex128)
+        for t, term in enumerate(terms):
+            coefficients[t] = term.coefficient
+            for qubit, pauli in term.items():
+                if qubit not in index:
+                    raise HamiltonianFormatError(f"Qubit {qubit} is not in the given qubit order")
+                word, bit = divmod(index[qubit], 64)
+                if pauli != cirq.Z:
+                    x_bits[t, word] |= np.uint64(1 << bit)
+                if pauli != cirq.X:
+                    z_bits[t, word] |= np.uint64(1 << bit)
+        return cls(qubits, x_bits, z_bits, coefficients)
+
+    def to_pauli_sum(self) -> cirq.PauliSum:
+        """Converts back to a cirq.PauliSum."""
+        x, z = self._unpacked()
+        terms = []
+        for t in range(len(self)):
+            paulis = {self.qubits[k]: _PAULIS[(x[t, k], z[t, k])]
+                      for k in np.flatnonzero(x[t] | z[t])}
+            terms.append(cirq.PauliString(paulis, coefficient=complex(self.coefficients[t])))
+        return cirq.PauliSum.from_pauli_strings(terms)
+
+    def with_coefficients(self, coefficients: np.ndarray) -> "PackedHamiltonian":
+        """
+        Returns a Hamiltonian with the same Pauli strings and new coefficients.
+
+        The bitmasks are shared with this instance, so a memory-mapped Hamiltonian
+        stays backed by its file and pickles as the path plus the new coefficients.
+        """
+        return PackedHamiltonian(self.qubits, self.x_bits, self.z_bits,
+                                 np.asarray(coefficients, dtype=np.complex128), path=self.path)
+
+    def fingerprint(self) -> str:
+        """
+        Digest of the qubits and terms, independent of term order.
+
+        Computed once and cached; the arrays are treated as immutable.
+        """
+        if self._fingerprint is None:
+            coefficients = np.asarray(self.coefficients, dtype=np.complex128)
+            x_bits = np.asarray(self.x_bits, dtype=np.uint64)
+            z_bits = np.asarray(self.z_bits, dtype=np.uint64)
+            # np.lexsort uses the last key as the primary one
+            sort_keys = [coefficients.imag, coefficients.real, *z_bits.T[::-1], *x_bits.T[::-1]]
+            order = np.lexsort(sort_keys) if len(self) else np.arange(0)
+            digest = hashlib.sha256(repr(self.qubits).encode())
+            for array in (x_bits[order], z_bits[order], coefficients[order]):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def weights(self) -> np.ndarray:
+        """Number of non-identity Paulis in each term."""
+        x, z = self._unpacked()
+        return (x | z).sum(axis=1)
+
+    def _unpacked(self) -> Tuple[np.ndarray, np.ndarray]:
+        """X and Z bits as uint8 arrays of shape (n_terms, n_qubits)."""
+        def unpack(bits):
+            as_bytes = np.ascontiguousarray(bits).astype('<u8').view(np.uint8)
+            return np.unpackbits(as_bytes, axis=1, bitorder='little')[:, :self.n_qubits]
+        return unpack(self.x_bits), unpack(self.z_bits)
+
+    def _basis_masks(self,
+                     qubit_map: Dict[cirq.Qid, int],
+                     n_qubits: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        X/Z masks as integers over the computational basis (big-endian, as in cirq)
+        plus each term's phase coefficient * i^(#Y).
+        """
+        if n_qubits > 62:
+            raise HamiltonianFormatError("Basis-state operations support at most 62 qubits")
+        x, z = self._unpacked()
+        positions = np.array([n_qubits - 1 - qubit_map[q] for q in self.qubits], dtype=np.int64)
+        weights = np.left_shift(np.int64(1), positions)
+        x_masks = x.astype(np.int64) @ weights
+        z_masks = z.astype(np.int64) @ weights
+        phases = self.coefficients * np.array([1, 1j, -1, -1j])[(x & z).sum(axis=1) % 4]
+        return x_masks, z_masks, phases
+
+    def expectation_from_state_vector(self,
+                                      state_vector: np.ndarray,
+                                      qubit_map: Dict[cirq.Qid, int]) -> complex:
+        """Computes <psi|H|psi>, with the same qubit_map convention as cirq.PauliSum."""
+        n_qubits = int(np.log2(len(state_vector)))
+        x_masks, z_masks, phases = self._basis_masks(qubit_map, n_qubits)
+        basis = np.arange(len(state_vector), dtype=np.int64)
+        total = 0j
+        for x_mask, z_mask, phase in zip(x_masks, z_masks, phases):
+            signs = 1 - 2 * _parity(basis & z_mask)
+            total += phase * np.vdot(state_vector[basis ^ x_mask], signs * state_vector)
+        return total
+
+    def sparse_matrix(self, qubits: Optional[Sequence[cirq.Qid]] = None) -> scipy.sparse.csr_matrix:
+        """Builds H as a sparse matrix over `qubits` (default: the Hamiltonian's own order)."""
+        qubits = self.qubits if qubits is None else list(qubits)
+        dim = 2 ** len(qubits)
+        x_masks, z_masks, phases = self._basis_masks({q: i for i, q in enumerate(qubits)}, len(qubits))
+        basis = np.arange(dim, dtype=np.int64)
+        rows, cols, data = [], [], []
+        for x_mask, z_mask, phase in zip(x_masks, z_masks, phases):
+            rows.append(basis ^ x_mask)
+            cols.append(basis)
+            data.append(phase * (1 - 2 * _parity(basis & z_mask)))
+        if not data:
+            return scipy.sparse.csr_matrix((dim, dim), dtype=np.complex128)
+        return scipy.sparse.coo_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))), shape=(dim, dim)
+        ).tocsr()
+
+    def matrix(self, qubits: Optional[Sequence[cirq.Qid]] = None) -> np.ndarray:
+        """Dense matrix of H (mirrors cirq.PauliSum.matrix)."""
+        return self.sparse_matrix(qubits).toarray()
+
+    def save(self, path: str):
+        """
+        Saves the Hamiltonian.
+
+        Paths ending in '.npz' use numpy's archive format. Any other path uses a raw
+        format (JSON header followed by aligned arrays) that `load` memory-maps.
+        """
+        qubits_json = cirq.to_json(self.qubits)
+        if path.endswith(".npz"):
+            np.savez(path, x_bits=self.x_bits, z_bits=self.z_bits,
+                     coefficients=self.coefficients, qubits=np.array(qubits_json))
+            return
+
+        arrays = [("x_bits", np.ascontiguousarray(self.x_bits, dtype='<u8')),
+                  ("z_bits", np.ascontiguousarray(self.z_bits, dtype='<u8')),
+                  ("coefficients", np.ascontiguousarray(self.coefficients, dtype='<c16'))]
+        header = {"qubits": qubits_json, "n_terms": len(self), "arrays": {}}
+        # Reserve room for the header, then lay arrays out on aligned offsets
+        offset = _ALIGNMENT * (1 + (len(json.dumps(header)) + 256 * len(arrays)) // _ALIGNMENT)
+        for name, array in arrays:
+            header["arrays"][name] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+            offset += _ALIGNMENT * (-(-array.nbytes // _ALIGNMENT))
+        header_bytes = json.dumps(header).encode()
+        data_start = header["arrays"]["x_bits"]["offset"]
+        if len(_MAGIC) + 8 + len(header_bytes) > data_start:
+            raise HamiltonianFormatError("Header does not fit in the reserved space")
+
+        with open(path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(np.uint64(len(header_bytes)).tobytes())
+            f.write(header_bytes)
+            for name, array in arrays:
+                f.seek(header["arrays"][name]["offset"])
+                f.write(array.tobytes())
+            f.truncate(offset)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "PackedHamiltonian":
+        """
+        Loads a Hamiltonian written by `save`.
+
+        Args:
+            path: File to load.
+            mmap: For the raw format, memory-map the arrays read-only instead of
+                  reading them into memory. Ignored for '.npz' files.
+        """
+        if path.endswith(".npz"):
+            with np.load(path) as data:
+                qubits = cirq.read_json(json_text=str(data["qubits"]))
+                return cls(qubits, data["x_bits"], data["z_bits"], data["coefficients"])
+
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise HamiltonianFormatError(f"'{path}' is not a packed Hamiltonian file")
+            header_len = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            header = json.loads(f.read(header_len))
+        qubits = cirq.read_json(json_text=header["qubits"])
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            shape = tuple(spec["shape"])
+            if mmap and np.prod(shape) > 0:
+                arrays[name] = np.memmap(path, dtype=spec["dtype"], mode="r",
+                                         offset=spec["offset"], shape=shape)
+            else:
+                arrays[name] = np.fromfile(path, dtype=spec["dtype"], count=int(np.prod(shape)),
+                                           offset=spec["offset"]).reshape(shape)
+        return cls(qubits, arrays["x_bits"], arrays["z_bits"], arrays["coefficients"],
+                   path=path if mmap else None)
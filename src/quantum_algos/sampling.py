@@ -0,0 +1,179 @@
+import cirq
+import numpy as np
+from typing import List, Dict, Optional, Tuple
+from quantum_algos.errors import CircuitError
+
+class PackedCounts:
+    """
+    Measurement counts keyed by bit-packed outcomes.
+
+    Each distinct outcome is stored once as a row of uint64 words (most significant
+    word first) with its count, so memory scales with the number of distinct
+    outcomes rather than with repetitions x bits. Outcome integers follow cirq's
+    big-endian convention: the first measured qubit is the most significant bit,
+    matching the keys of `cirq.Result.histogram`.
+    """
+
+    def __init__(self, n_bits: int):
+        """
+        Args:
+            n_bits: Number of measured bits per shot.
+        """
+        self.n_bits = n_bits
+        self.n_words = max(1, -(-n_bits // 64))
+        self.keys = np.zeros((0, self.n_words), dtype=np.uint64)
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __repr__(self) -> str:
+        return f"PackedCounts(n_bits={self.n_bits}, distinct={len(self)}, total={self.total})"
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def add_bits(self, bits: np.ndarray):
+        """Adds shots given as a (shots, n_bits) array of 0/1 (as in `cirq.Result.measurements`)."""
+        bits = np.asarray(bits, dtype=np.uint8)
+        if bits.ndim != 2 or bits.shape[1] != self.n_bits:
+            raise CircuitError(f"Expected shots of {self.n_bits} bits, got shape {bits.shape}")
+        padded = np.zeros((bits.shape[0], self.n_words * 64), dtype=np.uint8)
+        padded[:, self.n_words * 64 - self.n_bits:] = bits
+        words = np.packbits(padded, axis=1, bitorder='big').view('>u8').astype(np.uint64)
+        self.add_keys(words)
+
+    def add_keys(self, keys: np.ndarray, counts: Optional[np.ndarray] = None):
+        """
+        Adds packed outcomes.
+
+        Args:
+            keys: uint64 array of shape (shots,) for n_bits <= 64, or (shots, n_words).
+            counts: Optional multiplicity of each key (default 1 each).
+        """
+        keys = np.asarray(keys, dtype=np.uint64).reshape(-1, self.n_words)
+        if counts is None:
+            counts = np.ones(len(keys), dtype=np.int64)
+        all_keys = np.concatenate([self.keys, keys])
+        all_counts = np.concatenate([self.counts, np.asarray(counts, dtype=np.int64)])
+        if self.n_words == 1:
+            unique, inverse = np.unique(all_keys[:, 0], return_inverse=True)
+            unique = unique[:, None]
+        else:
+            unique, inverse = np.unique(all_keys, axis=0, return_inverse=True)
+        self.keys = unique
+        self.counts = np.bincount(inverse.ravel(), weights=all_counts, minlength=len(unique)).astype(np.int64)
+
+    def merge(self, other: "PackedCounts"):
+        """Adds the counts of another PackedCounts with the same number of bits."""
+        if other.n_bits != self.n_bits:
+            raise CircuitError(f"Cannot merge counts over {other.n_bits} bits into {self.n_bits} bits")
+        self.add_keys(other.keys, other.counts)
+
+    def _to_int(self, key: np.ndarray) -> int:
+        value = 0
+        for word in key:
+            value = (value << 64) | int(word)
+        return value
+
+    def most_common(self, k: Optional[int] = None) -> List[Tuple[int, int]]:
+        """The `k` most frequent outcomes as (outcome, count), most frequent first."""
+        if k is None or k >= len(self):
+            top = np.argsort(-self.counts, kind='stable')
+        else:
+            top = np.argpartition(-self.counts, k - 1)[:k]
+            top = top[np.argsort(-self.counts[top], kind='stable')]
+        return [(self._to_int(self.keys[i]), int(self.counts[i])) for i in top]
+
+    def to_dict(self) -> Dict[int, int]:
+        """All counts as {outcome: count}, like `cirq.Result.histogram`."""
+        return {self._to_int(key): int(count) for key, count in zip(self.keys, self.counts)}
+
+    def bitstring(self, outcome: int) -> str:
+        return format(outcome, f'0{self.n_bits}b')
+
+def _measurement(circuit: cirq.Circuit, key: Optional[str]) -> Tuple[str, cirq.Operation]:
+    measurements = [op for op in circuit.all_operations() if cirq.is_measurement(op)]
+    keys = {cirq.measurement_key_name(op) for op in measurements}
+    if key is None:
+        if len(keys) != 1:
+            raise CircuitError(f"Circuit has measurement keys {sorted(keys)}; specify `key`")
+        key = keys.pop()
+    ops = [op for op in measurements if cirq.measurement_key_name(op) == key]
+    if len(ops) != 1:
+        raise CircuitError(f"Expected exactly one measurement with key '{key}', found {len(ops)}")
+    return key, ops[0]
+
+def _samples_from_state(circuit: cirq.Circuit, measurement: cirq.Operation) -> bool:
+    """
+    Whether shots can be drawn from one final state: terminal measurements, no
+    noise, and outcomes that fit one packed word (at most 63 measured qubits).
+    """
+    if len(measurement.qubits) > 63:
+        return False
+    gate = measurement.gate
+    if not isinstance(gate, cirq.MeasurementGate) or any(gate.full_invert_mask()) or gate.confusion_map:
+        return False
+    if not circuit.are_all_measurements_terminal():
+        return False
+    return cirq.has_unitary(cirq.drop_terminal_measurements(circuit))
+
+def sample_counts(circuit: cirq.Circuit,
+                  key: Optional[str] = None,
+                  repetitions: int = 1000,
+                  chunk_size: int = 1_000_000,
+                  seed: Optional[int] = None) -> PackedCounts:
+    """
+    Samples a measurement and accumulates bit-packed counts chunk by chunk.
+
+    For circuits with only terminal measurements, no noise and at most 63
+    measured qubits, the final state is simulated once and outcomes are drawn
+    from its marginal distribution directly as packed integers. Otherwise the
+    circuit is run `chunk_size` repetitions at a time. Either way, memory is bounded by the chunk size and the number of
+    distinct outcomes, not by `repetitions`.
+
+    Args:
+        circuit: Circuit to sample.
+        key: Measurement key (default: the circuit's only key).
+        repetitions: Total number of shots.
+        chunk_size: Shots generated per chunk.
+        seed: Seed for reproducible sampling.
+
+    Returns:
+        PackedCounts over the measured bits.
+    """
+    key, measurement = _measurement(circuit, key)
+    measured = list(measurement.qubits)
+    counts = PackedCounts(len(measured))
+    rng = np.random.default_rng(seed)
+
+    if _samples_from_state(circuit, measurement):
+        qubits = sorted(circuit.all_qubits())
+        state = cirq.Simulator().simulate(
+            cirq.drop_terminal_measurements(circuit), qubit_order=qubits
+        ).final_state_vector
+        # cirq's state is complex64; a float32 CDF stops growing once per-outcome
+        # probabilities fall below half an ulp of the running sum (~25 qubits)
+        probs = (np.abs(state).astype(np.float64) ** 2).reshape((2,) * len(qubits))
+        axes = [qubits.index(q) for q in measured]
+        marginal = probs.sum(axis=tuple(i for i in range(len(qubits)) if i not in axes))
+        # Remaining axes are in qubit order; reorder them to measurement order
+        remaining = sorted(axes)
+        marginal = marginal.transpose([remaining.index(i) for i in axes]).ravel()
+        cdf = np.cumsum(marginal)
+        cdf /= cdf[-1]
+        for start in range(0, repetitions, chunk_size):
+            shots = min(chunk_size, repetitions - start)
+            outcomes = np.searchsorted(cdf, rng.random(shots), side='right')
+            outcomes = np.minimum(outcomes, len(cdf) - 1)
+            unique, unique_counts = np.unique(outcomes, return_counts=True)
+            counts.add_keys(unique.astype(np.uint64), unique_counts)
+        return counts
+
+    simulator = cirq.Simulator(seed=rng)
+    for start in range(0, repetitions, chunk_size):
+        shots = min(chunk_size, repetitions - start)
+        result = simulator.run(circuit, repetitions=shots)
+        counts.add_bits(result.measurements[key])
+    return counts
@@ -0,0 +1,217 @@
+import sys
+import threading
+import numpy as np
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, Optional, Tuple
+from quantum_algos.errors import SharedArrayError
+
+# Segments attached in this process, kept alive for as long as their views may be used
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+_register_lock = threading.Lock()
+
+def _open_untracked(name: str) -> shared_memory.SharedMemory:
+    """Attaches to an existing segment without making this process responsible for unlinking it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 attaching always registers the segment with the resource tracker,
+    # which unlinks registered segments when the process that uses it exits. Under
+    # spawn/forkserver a worker has its own tracker; under fork it shares the
+    # owner's, so a later unregister would also drop the owner's registration.
+    # Registration is therefore skipped. The lock is also held while SharedArray
+    # creates segments, so those are always registered; segments created directly
+    # through multiprocessing by other threads are not covered, which is why this
+    # workaround is limited to Python < 3.13.
+    from multiprocessing import resource_tracker
+    with _register_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None if rtype == "shared_memory" else register(name, rtype)
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+class SharedArrayHandle:
+    """
+    Picklable reference to a shared NumPy array.
+
+    Pass it to worker processes instead of the array itself. In workers, prefer
+    the scoped `attached()`; `attach()` keeps the segment mapped for the life of
+    the process (or until `detach_all()`).
+    """
+
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: str):
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = dtype
+
+    def __repr__(self) -> str:
+        return f"SharedArrayHandle(name={self.name!r}, shape={self.shape}, dtype={self.dtype!r})"
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    def _open(self) -> shared_memory.SharedMemory:
+        try:
+            return _open_untracked(self.name)
+        except FileNotFoundError:
+            raise SharedArrayError(f"Shared array '{self.name}' does not exist (already released?)")
+
+    def _view(self, shm: shared_memory.SharedMemory, writeable: bool) -> np.ndarray:
+        view = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+        view.flags.writeable = writeable
+        return view
+
+    def attach(self, writeable: bool = False) -> np.ndarray:
+        """
+        Returns a view of the shared array. The segment stays attached until
+        `detach_all()` is called or the process exits.
+
+        Args:
+            writeable: Whether the returned view may be written to.
+        """
+        shm = _attached.get(self.name)
+        if shm is None:
+            shm = self._open()
+            _attached[self.name] = shm
+        return self._view(shm, writeable)
+
+    @contextmanager
+    def attached(self, writeable: bool = False) -> Iterator[np.ndarray]:
+        """
+        Attaches for the duration of a `with` block, then closes the mapping.
+
+        Nothing is cached, so long-lived workers do not accumulate mappings of
+        segments the owner has since released. The view (and anything sliced
+        from it) is invalid after the block; copy what must outlive it.
+
+        Usage:
+            with handle.attached() as reference_state:
+                return vqe.fidelity(params, symbols, reference_state)
+
+        Args:
+            writeable: Whether the view may be written to.
+        """
+        shm = self._open()
+        try:
+            yield self._view(shm, writeable)
+        finally:
+            shm.close()
+
+def detach_all():
+    """Detaches every segment attached in this process. Views obtained earlier become invalid."""
+    for shm in _attached.values():
+        try:
+            shm.close()
+        except BufferError:
+            # A view is still alive; the mapping is released with the process
+            pass
+    _attached.clear()
+
+class SharedArray:
+    """
+    A NumPy array backed by a `multiprocessing.shared_memory` segment.
+
+    The creating process owns the segment and unlinks it on `release()` (or when
+    used as a context manager). Workers receive `handle` and attach zero-copy.
+
+    Usage:
+        with SharedArray.from_array(state_vector) as shared:
+            pool.map(work, [shared.handle] * n_tasks)
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype: str = "complex128"):
+        """
+        Allocates an uninitialized shared array.
+
+        Args:
+            shape: Array shape.
+            dtype: NumPy dtype.
+        """
+        nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        # Never create (and register) a segment while an attach has registration patched out
+        with _register_lock:
+            self._shm: Optional[shared_memory.SharedMemory] = shared_memory.SharedMemory(create=True, size=nbytes)
+        self.handle = SharedArrayHandle(self._shm.name, shape, np.dtype(dtype).str)
+        self.array = np.ndarray(self.handle.shape, dtype=self.handle.dtype, buffer=self._shm.buf)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "SharedArray":
+        """Copies `array` into a new shared segment."""
+        shared = cls(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def __del__(self):
+        self.release()
+
+    def __reduce__(self):
+        raise SharedArrayError("SharedArray cannot be pickled; pass its `handle` to workers instead")
+
+    def release(self):
+        """Frees the segment. Safe to call more than once."""
+        if getattr(self, "_shm", None) is None:
+            return
+        self.array = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # A view of `array` is still alive in this process; its pages are
+            # freed once it is garbage collected, after the unlink below.
+            pass
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+class SharedArrayStore:
+    """
+    Owns a named collection of shared arrays and releases them all together.
+
+    Usage:
+        with SharedArrayStore() as store:
+            handles = {"ground_state": store.put("ground_state", vector)}
+            ...  # fan out work with `handles`
+    """
+
+    def __init__(self):
+        self._arrays: Dict[str, SharedArray] = {}
+
+    def __enter__(self) -> "SharedArrayStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._arrays
+
+    def put(self, key: str, array: np.ndarray) -> SharedArrayHandle:
+        """Copies `array` into shared memory under `key` (replacing any previous array)."""
+        if key in self._arrays:
+            self._arrays.pop(key).release()
+        self._arrays[key] = SharedArray.from_array(array)
+        return self._arrays[key].handle
+
+    def handle(self, key: str) -> SharedArrayHandle:
+        return self._arrays[key].handle
+
+    def array(self, key: str) -> np.ndarray:
+        return self._arrays[key].array
+
+    def handles(self) -> Dict[str, SharedArrayHandle]:
+        return {key: shared.handle for key, shared in self._arrays.items()}
+
+    def release(self):
+        """Frees every array in the store."""
+        for shared in self._arrays.values():
+            shared.release()
+        self._arrays.clear()
@@ -1,49 +1,80 @@
-import matplotlib.pyplot as plt
+import copy
+import threading
+import time
 import cirq
+from concurrent.futures import Future, ThreadPoolExecutor
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from cirq.contrib.svg import SVGCircuit
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
+from quantum_algos.sampling import PackedCounts
 
-def plot_histogram(data: Any, title: str = "Qubit Measurement Results", filename: str = "histogram.png"):
+# All figures are built with the object-oriented API on their own Agg canvas,
+# never through pyplot's global state, so they can be rendered from any thread.
+
+def _new_figure() -> Figure:
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig
+
+def _histogram_figure(data: Any, title: str, top_k: Optional[int]) -> Figure:
+    fig = _new_figure()
+    ax = fig.add_subplot()
+    if isinstance(data, PackedCounts):
+        top = data.most_common(top_k)
+        ax.bar(range(len(top)), [count for _, count in top])
+        ax.set_xticks(range(len(top)))
+        ax.set_xticklabels([data.bitstring(outcome) for outcome, _ in top], rotation=90)
+    else:
+        cirq.plot_state_histogram(data, ax)
+    ax.set_title(title)
+    ax.set_xlabel("State")
+    ax.set_ylabel("Count")
+    return fig
+
+def _convergence_figure(history: List[float], title: str) -> Figure:
+    fig = _new_figure()
+    ax = fig.add_subplot()
+    ax.plot(history, marker='o')
+    ax.set_title(title)
+    ax.set_xlabel("Iteration")
+    ax.set_ylabel("Cost Value")
+    ax.grid(True)
+    return fig
+
+def plot_histogram(data: Any,
+                   title: str = "Qubit Measurement Results",
+                   filename: str = "histogram.png",
+                   top_k: Optional[int] = 32):
     """
     Plots a histogram of measurement results.
-    
+
     Args:
-        data: The histogram data (e.g., from result.histogram()).
+        data: The histogram data (e.g., from result.histogram()), or a PackedCounts.
         title: Title of the plot.
         filename: Output filename to save the plot.
+        top_k: For PackedCounts, only the `top_k` most frequent states are drawn
+               (None draws every observed state).
     """
-    plt.figure()
-    cirq.plot_state_histogram(data, plt.subplot())
-    plt.title(title)
-    plt.xlabel("State")
-    plt.ylabel("Count")
-    plt.savefig(filename)
+    _histogram_figure(data, title, top_k).savefig(filename)
     print(f"\nHistogram saved to '{filename}'")
-    plt.close()
 
 def plot_convergence(history: List[float], title: str = "Optimization Convergence", filename: str = "convergence.png"):
     """
     Plots the convergence of an optimization process (e.g., VQE cost function).
-    
+
     Args:
         history: List of cost values per iteration.
         title: Title of the plot.
         filename: Output filename to save the plot.
     """
-    plt.figure()
-    plt.plot(history, marker='o')
-    plt.title(title)
-    plt.xlabel("Iteration")
-    plt.ylabel("Cost Value")
-    plt.grid(True)
-    plt.savefig(filename)
+    _convergence_figure(history, title).savefig(filename)
     print(f"\nConvergence plot saved to '{filename}'")
-    plt.close()
 
 def save_circuit_svg(circuit: cirq.Circuit, filename: str = "circuit.svg"):
     """
     Saves the quantum circuit as an SVG file.
-    
+
     Args:
         circuit: The Cirq circuit to visualize.
         filename: Output filename (should end in .svg).
@@ -52,3 +83,129 @@ def save_circuit_svg(circuit: cirq.Circuit, filename: str = "circuit.svg"):
     with open(filename, 'w') as f:
         f.write(svg_string)
     print(f"\nCircuit SVG saved to '{filename}'")
+
+class RenderQueue:
+    """
+    Renders figures on a background thread pool so compute is not blocked.
+
+    Each method snapshots its inputs and returns a Future that resolves once the
+    file is written.
+
+    Usage:
+        with RenderQueue(max_workers=2) as renders:
+            for i, counts in enumerate(sweep):
+                renders.plot_histogram(counts, filename=f"hist_{i}.png")
+        # leaving the block waits for all pending renders
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """
+        Args:
+            max_workers: Number of rendering threads.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="render")
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "RenderQueue":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Runs `fn(*args, **kwargs)` on a rendering thread."""
+        future = self._executor.submit(fn, *args, **kwargs)
+        with self._lock:
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(future)
+        return future
+
+    def plot_histogram(self, data: Any, title: str = "Qubit Measurement Results",
+                       filename: str = "histogram.png", top_k: Optional[int] = 32) -> Future:
+        return self.submit(plot_histogram, copy.copy(data), title, filename, top_k)
+
+    def plot_convergence(self, history: List[float], title: str = "Optimization Convergence",
+                         filename: str = "convergence.png") -> Future:
+        return self.submit(plot_convergence, list(history), title, filename)
+
+    def save_circuit_svg(self, circuit: cirq.Circuit, filename: str = "circuit.svg") -> Future:
+        return self.submit(save_circuit_svg, circuit.copy(), filename)
+
+    def wait(self):
+        """Blocks until every submitted render has finished; re-raises the first error."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self):
+        """Waits for pending renders and stops the worker threads."""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+class LiveConvergencePlot:
+    """
+    Convergence plot that is updated incrementally while an optimization runs.
+
+    Call it with the current history (e.g. as the `callback` of `VQE.minimize`).
+    Redraws are throttled to at most one every `min_interval` seconds, run on a
+    background thread, and only update the existing line's data instead of
+    rebuilding the figure. Calls made while a redraw is in flight are coalesced.
+    """
+
+    def __init__(self,
+                 filename: str = "convergence.png",
+                 title: str = "Optimization Convergence",
+                 min_interval: float = 1.0,
+                 queue: Optional[RenderQueue] = None):
+        """
+        Args:
+            filename: File the plot is written to on every redraw.
+            title: Title of the plot.
+            min_interval: Minimum number of seconds between redraws.
+            queue: RenderQueue to draw on. Defaults to a private single-thread queue.
+        """
+        self.filename = filename
+        self.min_interval = min_interval
+        self._owns_queue = queue is None
+        self._queue = queue or RenderQueue(max_workers=1)
+        self._figure = _convergence_figure([], title)
+        self._line = self._figure.axes[0].lines[0]
+        self._in_flight: Optional[Future] = None
+        self._last_draw = float('-inf')
+        self._latest: Optional[List[float]] = None  # newest history not yet drawn
+        self.redraws = 0
+
+    def __call__(self, history: List[float]):
+        history = list(history)
+        now = time.monotonic()
+        throttled = now - self._last_draw < self.min_interval
+        if throttled or (self._in_flight is not None and not self._in_flight.done()):
+            # Remember the newest history; it is drawn by a later call or by close()
+            self._latest = history
+            return
+        self._latest = None
+        self._last_draw = now
+        self._in_flight = self._queue.submit(self._draw, history)
+
+    def _draw(self, history: List[float]):
+        self._line.set_data(range(len(history)), history)
+        ax = self._figure.axes[0]
+        ax.relim()
+        ax.autoscale_view()
+        self._figure.savefig(self.filename)
+        self.redraws += 1
+
+    def close(self):
+        """Draws the newest history (if not drawn yet) and waits for rendering to finish."""
+        if self._in_flight is not None:
+            self._in_flight.result()
+        if self._latest is not None:
+            self._queue.submit(self._draw, self._latest).result()
+            self._latest = None
+        if self._owns_queue:
+            self._queue.close()
+        print(f"\nConvergence plot saved to '{self.filename}'")
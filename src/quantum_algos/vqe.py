@@ -2,8 +2,11 @@ import cirq
 import numpy as np
 import sympy
 from scipy.optimize import minimize
-from typing import List, Callable, Tuple, Any
-from quantum_algos.visualization import plot_convergence
+from typing import List, Callable, Tuple, Any, Optional, Union
+from quantum_algos.visualization import plot_convergence, RenderQueue
+from quantum_algos.noise import NoiseModel, TrajectorySimulator, TrajectoryResult
+from quantum_algos.packed_hamiltonian import PackedHamiltonian
+from quantum_algos.errors import NoiseModelError
 
 class VQE:
     """Variational Quantum Eigensolver implementation."""
@@ -11,24 +14,46 @@ class VQE:
     def __init__(self, 
                  qubits: List[cirq.Qid], 
                  ansatz: Callable[[List[cirq.Qid], Any], cirq.Circuit],
-                 hamiltonian: cirq.PauliSum):
+                 hamiltonian: Union[cirq.PauliSum, PackedHamiltonian],
+                 noise_model: Optional[NoiseModel] = None,
+                 trajectory_simulator: Optional[TrajectorySimulator] = None):
         """
         Args:
             qubits: List of qubits used in the system.
             ansatz: Function that returns the parameterized circuit. 
                     Should accept (qubits, symbols).
             hamiltonian: The Hamiltonian operator to minimize expectation value for.
+                         A PackedHamiltonian is evaluated directly from its bitmasks.
+            noise_model: Optional noise model. If given, expectation values are
+                         estimated by sampling pure-state quantum trajectories.
+            trajectory_simulator: Optional trajectory settings (precision, workers, seed).
+                                  Defaults to a TrajectorySimulator for `noise_model`.
+                                  It carries its own noise model, so passing both
+                                  raises NoiseModelError.
         """
         self.qubits = qubits
         self.ansatz = ansatz
         self.hamiltonian = hamiltonian
         self.simulator = cirq.Simulator()
+        if noise_model is not None and trajectory_simulator is not None:
+            raise NoiseModelError("Pass either noise_model or trajectory_simulator, not both")
+        if trajectory_simulator is None and noise_model is not None:
+            trajectory_simulator = TrajectorySimulator(noise_model)
+        self.trajectory_simulator = trajectory_simulator
+        self.last_estimate: Optional[TrajectoryResult] = None
         self.history = []
 
     def expectation_value(self, params: List[float], symbols: List[sympy.Symbol]) -> float:
         """Calculates the expectation value <H> for given parameters."""
         resolver = cirq.ParamResolver(dict(zip(symbols, params)))
         circuit = self.ansatz(self.qubits, symbols)
+
+        if self.trajectory_simulator is not None:
+            # Noisy: average <H> over pure-state trajectories
+            self.last_estimate = self.trajectory_simulator.expectation(
+                cirq.resolve_parameters(circuit, resolver), self.hamiltonian, self.qubits
+            )
+            return self.last_estimate.mean
         
         # Simulate state
         # Note: For small systems, we can use simulate() to get the wave function
@@ -38,13 +63,30 @@ class VQE:
         
         # Calculate <psi|H|psi>
         # cirq.PauliSum.expectation_from_state_vector works efficiently
+        # (PackedHamiltonian provides the same method)
         expect = self.hamiltonian.expectation_from_state_vector(
             result.final_state_vector, 
             qubit_map={q: i for i, q in enumerate(self.qubits)}
         )
         return expect.real
 
-    def minimize(self, initial_params: List[float], symbols: List[sympy.Symbol], method: str = 'COBYLA') -> Any:
+    def fidelity(self, params: List[float], symbols: List[sympy.Symbol], reference_state: np.ndarray) -> float:
+        """
+        Calculates |<reference|psi(params)>|^2, e.g. against an exact ground state.
+
+        `reference_state` must use the qubit order of `self.qubits`; it may be a
+        zero-copy view from `SharedArrayHandle.attached()`.
+        """
+        resolver = cirq.ParamResolver(dict(zip(symbols, params)))
+        circuit = self.ansatz(self.qubits, symbols)
+        result = self.simulator.simulate(circuit, param_resolver=resolver, qubit_order=self.qubits)
+        return float(abs(np.vdot(reference_state, result.final_state_vector)) ** 2)
+
+    def minimize(self,
+                 initial_params: List[float],
+                 symbols: List[sympy.Symbol],
+                 method: str = 'COBYLA',
+                 callback: Optional[Callable[[List[float]], None]] = None) -> Any:
         """
         Runs the classical optimization loop.
         
@@ -52,6 +94,8 @@ class VQE:
             initial_params: Initial guess for parameters.
             symbols: List of sympy Symbols used in the ansatz.
             method: Scipy minimization method (default 'COBYLA').
+            callback: Optional function called with the history after every cost
+                      evaluation (e.g. a LiveConvergencePlot).
             
         Returns:
             Optimization result object from scipy.
@@ -61,11 +105,19 @@ class VQE:
         def cost_function(params):
             val = self.expectation_value(params, symbols)
             self.history.append(val)
+            if callback is not None:
+                callback(self.history)
             return val
 
         result = minimize(cost_function, initial_params, method=method)
         return result
 
-    def plot_history(self, filename: str = "vqe_convergence.png"):
-        """Plots the convergence history."""
+    def plot_history(self, filename: str = "vqe_convergence.png", queue: Optional[RenderQueue] = None):
+        """
+        Plots the convergence history.
+
+        With a RenderQueue the plot is rendered in the background and a Future is returned.
+        """
+        if queue is not None:
+            return queue.plot_convergence(self.history, title="VQE Optimization Trace", filename=filename)
         plot_convergence(self.history, title="VQE Optimization Trace", filename=filename)
@@ -0,0 +1,177 @@
+import asyncio
+import time
+import pytest
+import cirq
+import sympy
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from quantum_algos.jobs import JobRunner, DONE, QUEUED, RUNNING, CANCELLED
+from quantum_algos.vqe import VQE
+from quantum_algos.deutsch_jozsa import DeutschJozsa
+from quantum_algos.noise import NoiseModel, TrajectorySimulator
+from quantum_algos.errors import JobError, JobTimeoutError
+
+def _ising(n):
+    qubits = cirq.LineQubit.range(n)
+    return qubits, sum(-1.0 * cirq.Z(qubits[i]) * cirq.Z(qubits[i + 1]) for i in range(n - 1)) \
+        - 1.0 * cirq.X(qubits[0])
+
+def test_all_job_kinds_in_process_pool():
+    """VQE, eigensolver and Deutsch-Jozsa jobs run concurrently in worker processes."""
+    q = cirq.GridQubit(0, 0)
+    theta = sympy.Symbol('theta')
+
+    def ansatz(qubits, symbols):
+        # Local function: not picklable, so the runner must ship the circuit instead
+        return cirq.Circuit(cirq.ry(symbols[0]).on(qubits[0]))
+
+    async def main():
+        async with JobRunner(max_workers=2) as runner:
+            vqe_job = runner.submit_vqe(VQE([q], ansatz, cirq.Z(q)), [0.1], [theta])
+            energy_job = runner.submit_ground_state(cirq.X(q) + cirq.Z(q))
+            dj_job = runner.submit_deutsch_jozsa(DeutschJozsa(3, DeutschJozsa.create_balanced_oracle()))
+            return await asyncio.gather(vqe_job, energy_job, dj_job)
+
+    vqe_result, energy, dj_result = asyncio.run(main())
+    assert np.isclose(vqe_result.fun, -1.0, atol=0.1)
+    assert np.isclose(energy, -np.sqrt(2))
+    assert dj_result == "Balanced"
+
+def test_noisy_jobs_run_trajectories_serially():
+    """Trajectories of a noisy job run in its worker instead of a nested pool."""
+    sim = TrajectorySimulator(NoiseModel(depolarizing=0.01), max_trajectories=20, batch_size=10,
+                              max_workers=4, seed=0)
+
+    async def main():
+        async with JobRunner(max_workers=1, executor=ThreadPoolExecutor(1)) as runner:
+            dj = DeutschJozsa(2, DeutschJozsa.create_constant_oracle(0), trajectory_simulator=sim)
+            return await runner.submit_deutsch_jozsa(dj)
+
+    assert asyncio.run(main()) == "Constant"
+    assert sim._executor is None and sim.max_workers == 4
+
+def test_identical_jobs_are_deduplicated():
+    """Concurrent requests for the same Hamiltonian share one computation."""
+    qubits, h1 = _ising(3)
+    # Same Hamiltonian, terms in a different order
+    h2 = -1.0 * cirq.X(qubits[0]) - 1.0 * cirq.Z(qubits[1]) * cirq.Z(qubits[2]) \
+        - 1.0 * cirq.Z(qubits[0]) * cirq.Z(qubits[1])
+
+    async def main():
+        async with JobRunner(max_workers=1, executor=ThreadPoolExecutor(1)) as runner:
+            jobs = [runner.submit_ground_state(h1), runner.submit_ground_state(h2)]
+            assert len(runner._in_flight) == 1
+            return await asyncio.gather(*jobs)
+
+    e1, e2 = asyncio.run(main())
+    assert e1 == e2
+
+def test_priority_and_progress():
+    """Queued jobs start in priority order and report state transitions."""
+    events = []
+    order = []
+
+    def progress(job, state):
+        events.append(state)
+        if state == RUNNING:
+            order.append(job.name)
+
+    async def main():
+        async with JobRunner(max_workers=1, executor=ThreadPoolExecutor(1)) as runner:
+            jobs = []
+            for name, n, priority in [("first", 2, 0), ("low", 3, 5), ("high", 4, 1)]:
+                _, h = _ising(n)
+                job = runner.submit_ground_state(h, priority=priority, progress=progress)
+                job.name = name
+                jobs.append(job)
+            await asyncio.gather(*jobs)
+            return [job.state for job in jobs]
+
+    states = asyncio.run(main())
+    assert order == ["first", "high", "low"]
+    assert states == [DONE, DONE, DONE]
+    assert events.count(QUEUED) == 3 and events.count(DONE) == 3
+
+def test_cancel_queued_job():
+    """A cancelled queued job never runs; other jobs still complete."""
+    _, h_a = _ising(2)
+    _, h_b = _ising(3)
+
+    async def main():
+        async with JobRunner(max_workers=1, executor=ThreadPoolExecutor(1)) as runner:
+            busy = runner.submit_ground_state(h_a)
+            queued = runner.submit_ground_state(h_b)
+            assert queued.cancel()
+            assert queued.state == CANCELLED
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            return await busy
+
+    assert np.isclose(asyncio.run(main()), -np.sqrt(2))
+
+def test_shared_job_survives_partial_cancel():
+    """Cancelling one of two deduplicated jobs does not cancel the other."""
+    _, h = _ising(3)
+
+    async def main():
+        async with JobRunner(max_workers=1, executor=ThreadPoolExecutor(1)) as runner:
+            a = runner.submit_ground_state(h)
+            b = runner.submit_ground_state(h)
+            a.cancel()
+            return await b
+
+    assert asyncio.run(main()) < 0
+
+def test_timeout():
+    """Jobs exceeding their timeout fail with JobTimeoutError."""
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            async with JobRunner(max_workers=1, executor=executor) as runner:
+                job = runner._submit("sleep", time.sleep, (0.5,), 0, 0.05, None)
+                with pytest.raises(JobTimeoutError):
+                    await job
+
+    asyncio.run(main())
+
+def test_timeout_does_not_starve_next_job():
+    """A timed-out job keeps its slot until it ends; the next job's clock starts only then."""
+    states = {}
+
+    def sleep_then(value):
+        def work(seconds):
+            time.sleep(seconds)
+            return value
+        return work
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            async with JobRunner(max_workers=1, executor=executor) as runner:
+                slow = runner._submit("a", sleep_then("a"), (1.0,), 0, 0.1, None)
+                fast = runner._submit("b", sleep_then("b"), (0.1,), 0, 0.5,
+                                      lambda job, state: states.setdefault(state, time.monotonic()))
+                start = time.monotonic()
+                with pytest.raises(JobTimeoutError):
+                    await slow
+                assert time.monotonic() - start < 0.5
+                assert RUNNING not in states
+                return await fast, start
+
+    value, start = asyncio.run(main())
+    assert value == "b"
+    assert states[RUNNING] - start >= 0.9
+
+def test_executor_requires_max_workers():
+    """The worker count must be given explicitly with a caller-owned executor."""
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(JobError):
+            JobRunner(executor=executor)
+
+def test_submit_requires_started_runner():
+    """Submitting before start() raises JobError."""
+    q = cirq.LineQubit(0)
+
+    async def main():
+        with pytest.raises(JobError):
+            JobRunner(max_workers=1).submit_ground_state(cirq.Z(q))
+
+    asyncio.run(main())
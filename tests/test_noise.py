@@ -0,0 +1,106 @@
+import pytest
+import cirq
+import sympy
+import numpy as np
+from quantum_algos.noise import NoiseModel, TrajectorySimulator
+from quantum_algos.vqe import VQE
+from quantum_algos.deutsch_jozsa import DeutschJozsa
+from quantum_algos.errors import NoiseModelError
+
+def test_invalid_probability():
+    """Probabilities outside [0, 1] are rejected."""
+    with pytest.raises(NoiseModelError):
+        NoiseModel(depolarizing=1.5)
+
+def test_noise_model_and_simulator_are_exclusive():
+    """A trajectory simulator carries its own model, so both cannot be given."""
+    q = cirq.LineQubit(0)
+    sim = TrajectorySimulator(NoiseModel(depolarizing=0.1))
+    with pytest.raises(NoiseModelError):
+        VQE([q], lambda qubits, symbols: cirq.Circuit(), cirq.Z(q),
+            noise_model=NoiseModel(), trajectory_simulator=sim)
+    with pytest.raises(NoiseModelError):
+        DeutschJozsa(1, lambda inputs, helper: [], noise_model=NoiseModel(), trajectory_simulator=sim)
+
+def test_noiseless_trajectories_match_exact():
+    """With no noise a single exact trajectory is used, so stderr is 0."""
+    q = cirq.LineQubit(0)
+    sim = TrajectorySimulator(NoiseModel(), max_trajectories=20, batch_size=5, max_workers=1, seed=1)
+    result = sim.expectation(cirq.Circuit(cirq.X(q)), cirq.Z(q), [q])
+    assert np.isclose(result.mean, -1.0)
+    assert np.isclose(result.stderr, 0.0)
+    assert result.n_trajectories == 1
+
+def test_measurement_moment_noise():
+    """Qubits measured in a moment skip gate noise; other qubits in it do not."""
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.Moment(cirq.X(q1), cirq.measure(q0, key='m')))
+    noisy = NoiseModel(depolarizing=0.1).noisy_circuit(circuit)
+    depolarized = {q for op in noisy.all_operations()
+                   if isinstance(op.gate, cirq.DepolarizingChannel) for q in op.qubits}
+    assert depolarized == {q1}
+
+def test_readout_error_attenuation():
+    """Readout error p scales a weight-w Pauli term by (1 - 2p)^w."""
+    q0, q1 = cirq.LineQubit.range(2)
+    sim = TrajectorySimulator(NoiseModel(readout_error=0.1), max_trajectories=2, max_workers=1)
+    result = sim.expectation(cirq.Circuit(), cirq.Z(q0) * cirq.Z(q1), [q0, q1])
+    assert np.isclose(result.mean, 0.8 ** 2)
+
+def test_amplitude_damping_estimate():
+    """After X and one damping step with gamma, <Z> = 2 * gamma - 1."""
+    q = cirq.LineQubit(0)
+    gamma = 0.3
+    sim = TrajectorySimulator(NoiseModel(amplitude_damping=gamma), max_trajectories=2000,
+                              batch_size=200, max_workers=1, seed=7)
+    result = sim.expectation(cirq.Circuit(cirq.X(q)), cirq.Z(q), [q])
+    assert abs(result.mean - (2 * gamma - 1)) < 5 * result.stderr
+
+def test_target_precision_stops_early():
+    """Sampling stops once the running standard error reaches the target."""
+    q = cirq.LineQubit(0)
+    sim = TrajectorySimulator(NoiseModel(depolarizing=0.2), max_trajectories=10000,
+                              target_precision=0.05, batch_size=50, max_workers=1, seed=3)
+    result = sim.expectation(cirq.Circuit(cirq.H(q)), cirq.X(q), [q])
+    assert result.converged
+    assert result.stderr <= 0.05
+    assert result.n_trajectories < 10000
+
+def test_process_pool_trajectories():
+    """Pooled trajectories reuse one pool and reproduce the seeded serial run."""
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q))
+    settings = dict(max_trajectories=400, target_precision=0.04, batch_size=25, seed=5)
+    serial = TrajectorySimulator(NoiseModel(depolarizing=0.2), max_workers=1, **settings)
+    expected = serial.expectation(circuit, cirq.Z(q), [q])
+    with TrajectorySimulator(NoiseModel(depolarizing=0.2), max_workers=2, **settings) as pooled:
+        result = pooled.expectation(circuit, cirq.Z(q), [q])
+        executor = pooled._executor
+        pooled.expectation(circuit, cirq.Z(q), [q])
+        assert pooled._executor is executor
+    assert pooled._executor is None
+    assert result.n_trajectories == expected.n_trajectories < 400
+    assert np.isclose(result.mean, expected.mean)
+
+def test_noisy_vqe():
+    """Noisy VQE cannot reach the noiseless ground energy -1, but gets close."""
+    q = cirq.GridQubit(0, 0)
+    theta = sympy.Symbol('theta')
+
+    def ansatz(qubits, symbols):
+        return cirq.Circuit(cirq.ry(symbols[0]).on(qubits[0]))
+
+    sim = TrajectorySimulator(NoiseModel(readout_error=0.05), max_trajectories=1, max_workers=1)
+    vqe = VQE([q], ansatz, cirq.Z(q), trajectory_simulator=sim)
+    result = vqe.minimize([0.1], [theta], method='COBYLA')
+    assert np.isclose(result.fun, -0.9, atol=0.05)
+    assert vqe.last_estimate is not None
+
+def test_noisy_deutsch_jozsa():
+    """Weak noise does not change the Deutsch-Jozsa classification."""
+    noise = NoiseModel(depolarizing=0.01, readout_error=0.01)
+    for oracle, expected in [(DeutschJozsa.create_constant_oracle(1), "Constant"),
+                             (DeutschJozsa.create_balanced_oracle(), "Balanced")]:
+        sim = TrajectorySimulator(noise, max_trajectories=200, max_workers=1, seed=11)
+        dj = DeutschJozsa(3, oracle, trajectory_simulator=sim)
+        assert dj.run() == expected
@@ -0,0 +1,119 @@
+import pickle
+import pytest
+import cirq
+import sympy
+import numpy as np
+from quantum_algos.packed_hamiltonian import PackedHamiltonian
+from quantum_algos.vqe import VQE
+from quantum_algos.noise import NoiseModel
+from quantum_algos.errors import HamiltonianFormatError
+from classical_algos.eigensolver import ClassicalEigensolver
+
+def _hamiltonian():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    return (0.5 * cirq.X(q0) * cirq.Y(q1) * cirq.Z(q2)
+            - 1.0 * cirq.Z(q0) * cirq.Z(q1)
+            + 0.3 * cirq.Y(q2)
+            - 0.7 * cirq.X(q1)
+            + 0.25 * cirq.PauliString())
+
+def test_round_trip():
+    """PauliSum -> PackedHamiltonian -> PauliSum is lossless."""
+    h = _hamiltonian()
+    packed = PackedHamiltonian.from_pauli_sum(h)
+    assert len(packed) == 5
+    assert packed.n_qubits == 3
+    assert packed.to_pauli_sum() == h
+
+def test_matrix_matches_cirq():
+    """The bitmask-built matrix equals cirq's, including Y phases."""
+    h = _hamiltonian()
+    packed = PackedHamiltonian.from_pauli_sum(h)
+    assert np.allclose(packed.matrix(), h.matrix(cirq.LineQubit.range(3)))
+
+def test_expectation_matches_cirq():
+    """Expectation values agree with cirq.PauliSum for a random state and qubit order."""
+    h = _hamiltonian()
+    packed = PackedHamiltonian.from_pauli_sum(h)
+    rng = np.random.default_rng(0)
+    state = rng.normal(size=8) + 1j * rng.normal(size=8)
+    state /= np.linalg.norm(state)
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    qubit_map = {q2: 0, q0: 1, q1: 2}
+    assert np.isclose(packed.expectation_from_state_vector(state, qubit_map),
+                      h.expectation_from_state_vector(state, qubit_map))
+
+@pytest.mark.parametrize("filename", ["h.npz", "h.pham"])
+def test_save_load(tmp_path, filename):
+    """Both the .npz and the raw memory-mapped format round-trip."""
+    h = _hamiltonian()
+    path = str(tmp_path / filename)
+    PackedHamiltonian.from_pauli_sum(h).save(path)
+    loaded = PackedHamiltonian.load(path)
+    assert loaded.to_pauli_sum() == h
+
+def test_raw_format_is_memory_mapped(tmp_path):
+    """The raw format is memory-mapped and pickles by path."""
+    path = str(tmp_path / "h.pham")
+    PackedHamiltonian.from_pauli_sum(_hamiltonian()).save(path)
+    loaded = PackedHamiltonian.load(path)
+    assert isinstance(loaded.coefficients, np.memmap)
+    assert len(pickle.dumps(loaded)) < 200
+    assert pickle.loads(pickle.dumps(loaded)).to_pauli_sum() == _hamiltonian()
+
+def test_invalid_file(tmp_path):
+    """Loading a file that is not a packed Hamiltonian raises HamiltonianFormatError."""
+    path = tmp_path / "bad.pham"
+    path.write_bytes(b"not a hamiltonian")
+    with pytest.raises(HamiltonianFormatError):
+        PackedHamiltonian.load(str(path))
+
+def test_eigensolver_from_packed():
+    """ClassicalEigensolver accepts a PackedHamiltonian, including the sparse path."""
+    h = _hamiltonian()
+    packed = PackedHamiltonian.from_pauli_sum(h)
+    assert np.isclose(ClassicalEigensolver(packed).compute_ground_state_energy(),
+                      ClassicalEigensolver(h).compute_ground_state_energy())
+
+    qubits = cirq.LineQubit.range(11)
+    ising = sum(-1.0 * cirq.Z(qubits[i]) * cirq.Z(qubits[i + 1]) for i in range(10))
+    energy = ClassicalEigensolver(PackedHamiltonian.from_pauli_sum(ising)).compute_ground_state_energy()
+    assert np.isclose(energy, -10.0)
+
+def test_vqe_with_packed():
+    """VQE minimizes a PackedHamiltonian directly."""
+    q0, q1 = cirq.GridQubit(0, 0), cirq.GridQubit(0, 1)
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+
+    def ansatz(qubits, symbols):
+        return cirq.Circuit(cirq.ry(symbols[0]).on(qubits[0]), cirq.ry(symbols[1]).on(qubits[1]))
+
+    packed = PackedHamiltonian.from_pauli_sum(cirq.Z(q0) + cirq.Z(q1))
+    result = VQE([q0, q1], ansatz, packed).minimize([0.1, 0.1], [a, b], method='COBYLA')
+    assert np.isclose(result.fun, -2.0, atol=0.1)
+
+def test_readout_attenuation_on_packed():
+    """Readout error folds into packed coefficients the same way as for a PauliSum."""
+    h = _hamiltonian()
+    noise = NoiseModel(readout_error=0.1)
+    packed = noise.readout_attenuated(PackedHamiltonian.from_pauli_sum(h))
+    qubits = cirq.LineQubit.range(3)
+    assert np.allclose(packed.matrix(qubits), noise.readout_attenuated(h).matrix(qubits))
+
+def test_attenuated_copy_stays_file_backed(tmp_path):
+    """Rescaled copies of a memory-mapped Hamiltonian pickle as path plus coefficients."""
+    path = str(tmp_path / "h.pham")
+    PackedHamiltonian.from_pauli_sum(_hamiltonian()).save(path)
+    attenuated = NoiseModel(readout_error=0.1).readout_attenuated(PackedHamiltonian.load(path))
+    assert attenuated.path == path
+    restored = pickle.loads(pickle.dumps(attenuated))
+    assert restored.path == path and isinstance(restored.x_bits, np.memmap)
+    assert np.array_equal(restored.coefficients, attenuated.coefficients)
+
+def test_fingerprint_ignores_term_order():
+    """Fingerprints depend on the terms, not on their order."""
+    h = _hamiltonian()
+    packed = PackedHamiltonian.from_pauli_sum(h)
+    reordered = PackedHamiltonian.from_pauli_sum(cirq.PauliSum.from_pauli_strings(list(h)[::-1]))
+    assert packed.fingerprint() == reordered.fingerprint()
+    assert packed.fingerprint() != packed.with_coefficients(2 * packed.coefficients).fingerprint()
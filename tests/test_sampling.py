@@ -0,0 +1,92 @@
+import pytest
+import cirq
+import numpy as np
+from quantum_algos.sampling import PackedCounts, sample_counts
+from quantum_algos.visualization import plot_histogram
+from quantum_algos.errors import CircuitError
+
+def test_packed_bits_match_cirq_histogram():
+    """Packing cirq measurement bits gives the same keys as cirq.Result.histogram."""
+    q = cirq.LineQubit.range(5)
+    circuit = cirq.Circuit(cirq.H.on_each(*q), cirq.measure(*q, key='m'))
+    result = cirq.Simulator(seed=1).run(circuit, repetitions=500)
+    counts = PackedCounts(5)
+    counts.add_bits(result.measurements['m'])
+    assert counts.to_dict() == dict(result.histogram(key='m'))
+    assert counts.total == 500
+
+def test_more_than_64_bits():
+    """Outcomes wider than one uint64 word are packed into several words."""
+    counts = PackedCounts(70)
+    bits = np.zeros((3, 70), dtype=np.int8)
+    bits[0, 0] = 1   # most significant bit
+    bits[1, -1] = 1  # least significant bit
+    bits[2, -1] = 1
+    counts.add_bits(bits)
+    assert counts.n_words == 2
+    assert counts.to_dict() == {1 << 69: 1, 1: 2}
+    assert counts.most_common(1) == [(1, 2)]
+
+def test_chunked_accumulation_and_merge():
+    """Counts accumulated in chunks or merged from parts are the same."""
+    rng = np.random.default_rng(0)
+    keys = rng.integers(0, 16, size=1000).astype(np.uint64)
+    whole = PackedCounts(4)
+    whole.add_keys(keys)
+    parts = [PackedCounts(4), PackedCounts(4)]
+    parts[0].add_keys(keys[:300])
+    parts[1].add_keys(keys[300:])
+    parts[0].merge(parts[1])
+    assert parts[0].to_dict() == whole.to_dict()
+    assert whole.to_dict() == {int(k): int(c) for k, c in zip(*np.unique(keys, return_counts=True))}
+
+def test_sample_from_state_distribution():
+    """The direct state sampling path reproduces the measurement distribution and bit order."""
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    # q1 is always 1, q0 is a fair coin, q2 is not measured
+    circuit = cirq.Circuit(cirq.X(q1), cirq.H(q0), cirq.H(q2), cirq.measure(q1, q0, key='m'))
+    counts = sample_counts(circuit, repetitions=20000, chunk_size=3000, seed=3)
+    assert counts.total == 20000
+    assert set(counts.to_dict()) == {0b10, 0b11}
+    assert abs(counts.to_dict()[0b10] / 20000 - 0.5) < 0.02
+
+def test_sample_wide_uniform_superposition():
+    """The CDF keeps full precision at 25 measured qubits (float32 stalls there)."""
+    n = 25
+    q = cirq.LineQubit.range(n)
+    circuit = cirq.Circuit(cirq.H.on_each(*q), cirq.measure(*q, key='m'))
+    counts = sample_counts(circuit, repetitions=20000, seed=4)
+    top = counts.counts[(counts.keys[:, 0] >> np.uint64(n - 1)) == 1].sum()
+    assert abs(top / counts.total - 0.5) < 0.02
+
+def test_sample_with_mid_circuit_measurement():
+    """Circuits that cannot be sampled from one state fall back to chunked runs."""
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(q0), cirq.measure(q0, key='a'), cirq.CNOT(q0, q1),
+                           cirq.measure(q0, q1, key='m'))
+    counts = sample_counts(circuit, key='m', repetitions=50, chunk_size=7, seed=1)
+    assert counts.to_dict() == {0b11: 50}
+
+def test_sample_more_than_63_measured_qubits():
+    """Wide terminal measurements fall back to chunked runs with multi-word keys."""
+    q = cirq.LineQubit.range(70)
+    circuit = cirq.Circuit(cirq.X(q[0]), cirq.X(q[69]), cirq.measure(*q, key='m'))
+    counts = sample_counts(circuit, repetitions=10, chunk_size=4, seed=0)
+    assert counts.n_words == 2
+    assert counts.to_dict() == {(1 << 69) | 1: 10}
+
+def test_sample_requires_key():
+    """A circuit with several measurement keys needs an explicit key."""
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.measure(q0, key='a'), cirq.measure(q1, key='b'))
+    with pytest.raises(CircuitError):
+        sample_counts(circuit)
+
+def test_plot_histogram_top_k(tmp_path):
+    """plot_histogram accepts PackedCounts and draws only the top states."""
+    q = cirq.LineQubit.range(10)
+    circuit = cirq.Circuit(cirq.H.on_each(*q), cirq.measure(*q, key='m'))
+    counts = sample_counts(circuit, repetitions=5000, seed=2)
+    filename = tmp_path / "hist.png"
+    plot_histogram(counts, filename=str(filename), top_k=8)
+    assert filename.exists()
@@ -0,0 +1,85 @@
+import pickle
+import pytest
+import cirq
+import sympy
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from quantum_algos import shared_arrays
+from quantum_algos.shared_arrays import SharedArray, SharedArrayStore, SharedArrayHandle, detach_all
+from quantum_algos.vqe import VQE
+from quantum_algos.errors import SharedArrayError
+from classical_algos.eigensolver import ClassicalEigensolver
+
+def _ground_state_fidelity(handle: SharedArrayHandle, theta: float) -> float:
+    q = cirq.LineQubit(0)
+    s = sympy.Symbol('s')
+    vqe = VQE([q], lambda qubits, symbols: cirq.Circuit(cirq.ry(symbols[0]).on(qubits[0])), cirq.Z(q))
+    with handle.attached() as reference_state:
+        return vqe.fidelity([theta], [s], reference_state)
+
+def _write_ones(handle: SharedArrayHandle):
+    with handle.attached(writeable=True) as view:
+        view[:] = 1.0
+
+def test_attach_is_zero_copy():
+    """Views attached through the handle share memory with the owner."""
+    with SharedArray.from_array(np.arange(8, dtype=np.float64)) as shared:
+        view = shared.handle.attach()
+        assert np.array_equal(view, np.arange(8))
+        shared.array[0] = 42.0
+        assert view[0] == 42.0
+        assert not view.flags.writeable
+        del view
+        detach_all()
+
+def test_scoped_attach_is_not_cached():
+    """attached() maps the segment only for the block and leaves no cache entry behind."""
+    with SharedArray.from_array(np.arange(4, dtype=np.float64)) as shared:
+        with shared.handle.attached() as view:
+            total = float(view.sum())
+            assert not view.flags.writeable
+        assert total == 6.0
+        assert shared.handle.name not in shared_arrays._attached
+    with pytest.raises(SharedArrayError):
+        with shared.handle.attached():
+            pass
+
+def test_handle_pickles_small():
+    """Only the handle crosses process boundaries, not the data."""
+    with SharedArray((1 << 16,), "complex128") as shared:
+        assert len(pickle.dumps(shared.handle)) < 300
+        with pytest.raises(SharedArrayError):
+            pickle.dumps(shared)
+
+def test_workers_read_and_write_shared_state():
+    """Worker processes attach to the eigensolver's ground state and can write back."""
+    q = cirq.LineQubit(0)
+    energy, ground_state = ClassicalEigensolver(cirq.Z(q)).compute_ground_state()
+    assert np.isclose(energy, -1.0)
+    with SharedArrayStore() as store:
+        handle = store.put("ground_state", ground_state)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            fidelities = list(pool.map(_ground_state_fidelity, [handle] * 2, [0.0, np.pi]))
+        assert np.allclose(fidelities, [0.0, 1.0])
+
+        ones = store.put("ones", np.zeros(4))
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            pool.submit(_write_ones, ones).result()
+        assert np.array_equal(store.array("ones"), np.ones(4))
+
+def test_release_unlinks():
+    """After release, the segment can no longer be attached."""
+    store = SharedArrayStore()
+    handle = store.put("v", np.ones(3))
+    assert "v" in store
+    store.release()
+    with pytest.raises(SharedArrayError):
+        handle.attach()
+
+def test_compute_ground_state_vector():
+    """The returned ground state vector is normalized and has the ground energy."""
+    q0, q1 = cirq.LineQubit.range(2)
+    hamiltonian = -1.0 * cirq.Z(q0) * cirq.Z(q1) - 1.0 * cirq.X(q0)
+    energy, vector = ClassicalEigensolver(hamiltonian).compute_ground_state()
+    assert np.isclose(np.linalg.norm(vector), 1.0)
+    assert np.isclose(np.vdot(vector, hamiltonian.matrix() @ vector).real, energy)
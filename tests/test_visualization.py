@@ -0,0 +1,80 @@
+import threading
+import cirq
+import sympy
+import numpy as np
+from quantum_algos.visualization import (
+    plot_histogram, plot_convergence, save_circuit_svg, RenderQueue, LiveConvergencePlot
+)
+from quantum_algos.sampling import sample_counts
+from quantum_algos.vqe import VQE
+
+def test_sync_functions_write_files(tmp_path):
+    """The synchronous helpers still write their files."""
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.H(q), cirq.measure(q, key='m'))
+    result = cirq.Simulator(seed=1).run(circuit, repetitions=10)
+    plot_histogram(result.histogram(key='m'), filename=str(tmp_path / "h.png"))
+    plot_convergence([3.0, 2.0, 1.0], filename=str(tmp_path / "c.png"))
+    save_circuit_svg(circuit, filename=str(tmp_path / "c.svg"))
+    assert all((tmp_path / name).exists() for name in ["h.png", "c.png", "c.svg"])
+
+def test_no_pyplot_figures_left_open(tmp_path):
+    """Rendering does not create figures in pyplot's global state."""
+    import matplotlib.pyplot as plt
+    before = plt.get_fignums()
+    plot_convergence([1.0, 0.5], filename=str(tmp_path / "c.png"))
+    assert plt.get_fignums() == before
+
+def test_render_queue_renders_in_background(tmp_path):
+    """Renders run on worker threads and are snapshotted at submission."""
+    q = cirq.LineQubit.range(3)
+    counts = sample_counts(cirq.Circuit(cirq.H.on_each(*q), cirq.measure(*q, key='m')),
+                           repetitions=100, seed=0)
+    history = [1.0, 0.5]
+    render_threads = set()
+
+    def record_thread():
+        render_threads.add(threading.current_thread().name)
+
+    with RenderQueue(max_workers=2) as renders:
+        futures = [renders.plot_histogram(counts, filename=str(tmp_path / f"h{i}.png")) for i in range(4)]
+        futures.append(renders.plot_convergence(history, filename=str(tmp_path / "c.png")))
+        futures.append(renders.save_circuit_svg(cirq.Circuit(cirq.H.on_each(*q)), str(tmp_path / "c.svg")))
+        renders.submit(record_thread)
+        history.append(-100.0)  # must not affect the queued convergence plot
+    assert all(f.done() for f in futures)
+    assert len(list(tmp_path.iterdir())) == 6
+    assert render_threads and threading.current_thread().name not in render_threads
+
+def test_live_convergence_is_throttled(tmp_path):
+    """Live updates are coalesced: far fewer redraws than calls, final state always drawn."""
+    filename = tmp_path / "live.png"
+    live = LiveConvergencePlot(filename=str(filename), min_interval=60.0)
+    history = []
+    for i in range(200):
+        history.append(1.0 / (i + 1))
+        live(history)
+    live.close()
+    assert filename.exists()
+    assert live.redraws == 2
+    assert list(live._line.get_ydata()) == history
+
+def test_vqe_live_plot_callback(tmp_path):
+    """VQE.minimize drives a LiveConvergencePlot through its callback."""
+    q = cirq.GridQubit(0, 0)
+    theta = sympy.Symbol('theta')
+
+    def ansatz(qubits, symbols):
+        return cirq.Circuit(cirq.ry(symbols[0]).on(qubits[0]))
+
+    vqe = VQE([q], ansatz, cirq.Z(q))
+    live = LiveConvergencePlot(filename=str(tmp_path / "live.png"), min_interval=0.0)
+    result = vqe.minimize([0.1], [theta], callback=live)
+    live.close()
+    assert np.isclose(result.fun, -1.0, atol=0.1)
+    assert 1 <= live.redraws <= len(vqe.history) + 1
+    assert list(live._line.get_ydata()) == vqe.history
+
+    with RenderQueue() as renders:
+        future = vqe.plot_history(filename=str(tmp_path / "final.png"), queue=renders)
+    assert future.done() and (tmp_path / "final.png").exists()